@@ -19,11 +19,9 @@ uv run pyinstaller `
     --add-data "*.py;." `
     --hidden-import=cv2 `
     --hidden-import=moviepy `
-    --hidden-import=imagehash `
     --hidden-import=PIL `
     --hidden-import=numpy `
     --hidden-import=tkinter `
-    --hidden-import=scipy.signal `
     --clean `
     main.py
 
@@ -1,31 +1,210 @@
+import ast
+import bisect
+import functools
+import hashlib
+import io
+import itertools
+import multiprocessing
 import os
+import queue
+import sqlite3
 import threading
 import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import queue
+import zlib
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 import cv2
-import imagehash
 import numpy as np
-from moviepy.editor import VideoFileClip
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
 from PIL import Image, ImageTk, ImageSequence
 
+# Suppress OpenCV error messages once for the process (and each pool worker on import)
+cv2.setLogLevel(0)
+
 # --- Configuration ---
-IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp', '.gif', '.ico']
-VIDEO_EXTENSIONS = ['.mp4', '.avi', 'mkv', '.mov', '.wmv', '.webm', '.m4v', '.flv', '.mpg', '.mpeg', '.mts']
+IMAGE_EXTENSIONS = frozenset(['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp', '.gif', '.ico'])
+VIDEO_EXTENSIONS = frozenset(['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.webm', '.m4v', '.flv', '.mpg', '.mpeg', '.mts'])
+MEDIA_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
 THUMBNAIL_SIZE = (128, 128)
 # New preview size to better accommodate widescreen video
 PREVIEW_SIZE = (640, 480)
 # Preview pane will be calculated as 1/3 of window width
 PREVIEW_PANE_WIDTH = 450  # Base minimum width
+# Perceptual hash used for images and video frames:
+# "phash" (DCT), "dhash" (difference) or "ahash" (average)
+HASH_ALGORITHM = "phash"
+# Videos are first compared on this many sampled frames; only matches get the full signature
+VIDEO_PREFIX_FRAMES = 4
+# Sample gaps up to this many frames are skipped by decoding forward instead of seeking
+VIDEO_MAX_GRAB_GAP = 24
+# Containers whose seeks often restart decoding from the beginning; these are sampled
+# in one forward pass instead
+SEQUENTIAL_SAMPLING_EXTENSIONS = frozenset(['.mkv', '.webm', '.mts'])
+# Codecs (as OpenCV FOURCCs) whose frame seeks can land off target; these are sampled in
+# one forward pass too, and the preview player checks where its seeks landed
+INEXACT_SEEK_FOURCCS = frozenset(['VP80', 'VP90', 'AV01'])
+# Upper bound on files sent to a pool worker per task; smaller scans use smaller chunks
+HASH_CHUNK_SIZE = 128
+# Tasks queued on the pool at once; the rest are submitted as earlier ones finish
+MAX_PENDING_TASKS = (os.cpu_count() or 1) * 4
+# Images each pool worker reads from disk ahead of the one it is decoding
+IMAGE_READ_AHEAD = 4
+# Images whose hashes differ by at most this many bits are grouped as duplicates
+IMAGE_HASH_MAX_DISTANCE = 4
+# Milliseconds between refreshes of the scanning screen from the latest posted status
+SCAN_STATUS_POLL_MS = 50
+# Milliseconds a thumbnail grid waits after the last resize before re-laying itself out
+GRID_RELAYOUT_DELAY_MS = 100
+# Slider moves within this many milliseconds collapse into one seek of the preview player
+VIDEO_SEEK_COALESCE_MS = 30
+# Minimum seconds between progress updates sent to the UI while deleting files
+DELETE_STATUS_INTERVAL = 0.05
+# Hashes of unchanged files are reused across scans from this database
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".duplicate_media_finder_cache.sqlite")
+CACHE_COMMIT_INTERVAL = 1000
+# Video frames are shrunk to this size before checking whether they are a solid colour
+SOLID_CHECK_SIZE = (64, 64)
+# Rendered thumbnails are reused across sessions from this directory
+THUMBNAIL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".duplicate_media_finder_thumbs")
+# Least recently used thumbnails are pruned once the directory grows past this size
+THUMBNAIL_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# Processes decoding video thumbnails; kept small so disk reads stay mostly sequential
+VIDEO_THUMBNAIL_CONCURRENCY = 2
+# Thumbnail PhotoImages kept in memory, so tiles that are rebuilt show instantly
+PHOTO_CACHE_SIZE = 500
+# Full-size image previews kept in memory, so re-selecting a recent image skips decoding
+PREVIEW_CACHE_SIZE = 8
+# Preview-sized video frames the player keeps, so scrubbing back over them needs no seek
+VIDEO_FRAME_CACHE_SIZE = 120
+# Block size used when reading same-size files to check them for exact copies
+EXACT_MATCH_BLOCK_SIZE = 1024 * 1024
 
 # --- Core Hashing Functions ---
-def get_image_hash(filepath, hash_size=8):
+def average_hash_value(pixels):
+    """
+    Average hash of a small grayscale array, packed into an int.
+    Bits are laid out row-major with the first pixel as the most significant bit,
+    matching imagehash's hex representation.
+    """
+    bits = pixels > pixels.mean()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+def difference_hash_value(pixels):
+    """
+    Difference hash of a small grayscale array one column wider than it is tall,
+    packed into an int. Each bit is set when a pixel is brighter than its left
+    neighbour, matching imagehash.dhash's bit layout.
+    """
+    bits = pixels[:, 1:] > pixels[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+@functools.lru_cache(maxsize=None)
+def _dct_matrix(n):
+    """Unnormalised DCT-II basis, so D @ X @ D.T is the 2-D DCT of an n x n array.
+    Its scale differs from scipy's, which a median threshold ignores."""
+    k = np.arange(n)
+    return np.cos(np.pi * k[:, None] * (2 * k[None, :] + 1) / (2 * n))
+
+def dct_hash_value(pixels):
+    """
+    Perceptual (DCT) hash of a square grayscale array four times the hash size
+    across, packed into an int. Bits mark which low-frequency coefficients exceed
+    their median, matching imagehash.phash.
+    """
+    return int(perceptual_hash_batch(pixels[None], "phash")[0])
+
+# Hash function by algorithm name
+HASH_ALGORITHMS = {
+    "ahash": average_hash_value,
+    "dhash": difference_hash_value,
+    "phash": dct_hash_value,
+}
+
+def hash_input_size(hash_size, algorithm=HASH_ALGORITHM):
+    """Returns the (width, height) grayscale image an algorithm hashes."""
+    if algorithm == "dhash":
+        return (hash_size + 1, hash_size)
+    if algorithm == "phash":
+        return (hash_size * 4, hash_size * 4)
+    return (hash_size, hash_size)
+
+def perceptual_hash_batch(pixels, algorithm=HASH_ALGORITHM):
+    """
+    Hashes a (k, height, width) stack of small grayscale arrays in one vectorised
+    pass, returning a uint64 array with the same values as the per-array functions.
+    At most 64 bits per hash are supported.
     """
-    Generate a perceptual hash for an image.
+    if algorithm == "ahash":
+        bits = pixels > pixels.mean(axis=(1, 2), keepdims=True)
+    elif algorithm == "phash":
+        dct_matrix = _dct_matrix(pixels.shape[-1])
+        hash_size = pixels.shape[-1] // 4
+        low = (dct_matrix @ pixels.astype(np.float64) @ dct_matrix.T)[:, :hash_size, :hash_size]
+        bits = low > np.median(low.reshape(len(pixels), -1), axis=1)[:, None, None]
+    else:
+        bits = pixels[:, :, 1:] > pixels[:, :, :-1]
+    packed = np.packbits(bits.reshape(len(pixels), -1), axis=1)
+    if packed.shape[1] < 8:
+        # Left-pad short hashes to 8 bytes so every row reads as one big-endian integer
+        packed = np.pad(packed, ((0, 0), (8 - packed.shape[1], 0)))
+    # Reinterpret each row in place, then byte-swap once into native uint64
+    return packed.view('>u8').ravel().astype(np.uint64)
+
+# Number of set bits in every possible byte value, for vectorised popcounts
+_POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def _popcount_table(words):
+    """Set bits per uint64 via the byte lookup table (NumPy < 2.0 fallback)."""
+    return _POPCOUNT_8[words.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+# NumPy 2.0+ counts bits in a single ufunc; the choice is made once at import
+_popcount = getattr(np, "bitwise_count", _popcount_table)
+
+def hamming_distances(hashes, value):
+    """Returns the bit distance between value and every entry of a uint64 array."""
+    return _popcount(np.bitwise_xor(hashes, np.uint64(value)))
+
+def group_similar_image_hashes(hashes, max_distance=IMAGE_HASH_MAX_DISTANCE):
+    """
+    Merges image hash groups whose hashes are within max_distance bits of each other.
+    Takes and returns a dict of (is_animated, hash) -> paths; each merged group is
+    keyed by one of its member hashes. Animated and static images are never merged.
+    """
+    merged = defaultdict(list)
+    for is_animated in (False, True):
+        keys = [key for key in hashes if key[0] == is_animated]
+        if not keys:
+            continue
+        values = np.array([key[1] for key in keys], dtype=np.uint64)
+        
+        # Union-find over every pair within the distance threshold
+        parent = list(range(len(keys)))
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        if max_distance > 0:
+            for i in range(len(keys) - 1):
+                close = np.nonzero(hamming_distances(values[i + 1:], values[i]) <= max_distance)[0]
+                for j in close + (i + 1):
+                    root_i, root_j = find(i), find(int(j))
+                    if root_i != root_j:
+                        parent[root_j] = root_i
+        
+        for i, key in enumerate(keys):
+            merged[keys[find(i)]].extend(hashes[key])
+    return dict(merged)
+
+def get_image_hash(filepath, hash_size=8, algorithm=HASH_ALGORITHM):
+    """
+    Generate a perceptual hash for an image (a path or a binary file object).
     Crucially, this function differentiates between animated and static images
-    by prepending a prefix to the hash.
+    by returning an (is_animated, hash) pair.
     """
     try:
         with Image.open(filepath) as img:
@@ -33,24 +212,32 @@ def get_image_hash(filepath, hash_size=8):
             # The 'n_frames' attribute is the most reliable way.
             is_animated = getattr(img, 'n_frames', 1) > 1
             
-            # Calculate the standard average hash from the first frame.
-            core_hash = imagehash.average_hash(img.convert('RGB'), hash_size=hash_size)
+            # The hash only needs a tiny luminance image, so let the JPEG decoder
+            # downscale and emit grayscale directly during decoding (no-op for
+            # other formats) and shrink before hashing instead of converting the
+            # full-resolution image.
+            input_size = hash_input_size(hash_size, algorithm)
+            work_size = (max(input_size) * 4,) * 2
+            img.draft('L', work_size)
+            small = img.convert('L')
+            small.thumbnail(work_size, Image.BILINEAR)
+            small = small.resize(input_size, Image.LANCZOS)
+            
+            # Calculate the hash from the first frame.
+            core_hash = HASH_ALGORITHMS[algorithm](np.asarray(small))
 
-            # Return a hash prefixed to distinguish animated from static images.
-            # This ensures they are never in the same duplicate group.
-            if is_animated:
-                return f"anim_{core_hash}"
-            else:
-                return f"static_{core_hash}"
+            # Pair the hash with the animation flag to distinguish animated from
+            # static images. This ensures they are never in the same duplicate group.
+            return (is_animated, core_hash)
     except Exception: 
         return None
 
-def get_video_signature(filepath, hash_size=8, frames_to_compare=10):
-    """Generate a signature for a video by sampling frames evenly throughout the video"""
+def get_video_signature(filepath, hash_size=8, frames_to_compare=10, max_samples=None, algorithm=HASH_ALGORITHM):
+    """Generate a signature for a video by sampling frames evenly throughout the video.
+    The signature is the bytes of the sorted per-frame hashes packed as uint64 (hash_size <= 8).
+    max_samples restricts hashing to an evenly spread subset of the same sample positions,
+    giving a cheap prefilter signature that always matches between true duplicates."""
     try:
-        # Suppress OpenCV error messages
-        cv2.setLogLevel(0)
-        
         cap = cv2.VideoCapture(filepath)
         if not cap.isOpened(): 
             return None
@@ -72,126 +259,472 @@ def get_video_signature(filepath, hash_size=8, frames_to_compare=10):
         else:
             frame_indices = [int(i * (total_frames - 1) / (actual_frames_to_sample - 1)) 
                              for i in range(actual_frames_to_sample)]
-        
-        hashes = []
+        if max_samples and len(frame_indices) > max_samples:
+            step = len(frame_indices) // max_samples
+            frame_indices = frame_indices[::step][:max_samples]
+        
+        input_size = hash_input_size(hash_size, algorithm)
+        sequential = (get_extension(filepath) in SEQUENTIAL_SAMPLING_EXTENSIONS
+                      or video_fourcc(cap) in INEXACT_SEEK_FOURCCS)
+        max_grab_gap = total_frames if sequential else VIDEO_MAX_GRAB_GAP
+        small_frames = []
+        next_frame = 0
+        frame_buf = None  # Sampled frames are decoded into one reused array
         for frame_idx in frame_indices:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-            ret, frame = cap.read()
+            # A seek restarts decoding from the nearest keyframe, so short forward gaps
+            # are cheaper to cross with grab(), which decodes without converting frames.
+            gap = frame_idx - next_frame
+            if 0 < gap <= max_grab_gap and next_frame >= 0:
+                while gap and cap.grab():
+                    gap -= 1
+            if gap and not cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx):
+                # The backend refused the seek; decode forward to the sample instead
+                if not 0 < gap or next_frame < 0:
+                    continue
+                while gap and cap.grab():
+                    gap -= 1
+                if gap:
+                    break
+            ret, frame = cap.read(frame_buf)
+            next_frame = frame_idx + 1 if ret else -1
             if ret:
+                frame_buf = frame
                 try:
-                    img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                    hashes.append(str(imagehash.average_hash(img, hash_size=hash_size)))
+                    # Shrink the native BGR frame first so only hash_size² pixels are colour-converted
+                    small = cv2.resize(frame, input_size, interpolation=cv2.INTER_AREA)
+                    small_frames.append(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY))
                 except Exception:
                     continue  # Skip corrupted frames
         
         cap.release()
         
-        if not hashes: 
+        if not small_frames: 
             return None
             
-        # Sort hashes to ensure consistent signatures regardless of frame order
-        hashes.sort()
-        return "".join(hashes)
+        # Hash every sampled frame at once, then sort to ensure consistent
+        # signatures regardless of frame order
+        signature = perceptual_hash_batch(np.stack(small_frames), algorithm)
+        signature.sort()
+        return signature.tobytes()
         
     except Exception:
         return None
 
+def _video_metadata_audio_hash(filepath, issue):
+    """Fallback audio hash built from OpenCV video metadata when the audio track can't be read."""
+    try:
+        cap = cv2.VideoCapture(filepath)
+        if not cap.isOpened():
+            return "opencv_error", "Audio error - OpenCV error"
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        cap.release()
+        duration = frame_count / fps if fps > 0 else 0
+        
+        fallback_signature = f"fallback_{int(duration)}_{int(fps)}_unknown"
+        fallback_hash = zlib.crc32(fallback_signature.encode())
+        return str(fallback_hash), f"Audio processing failed - used video metadata fallback ({issue})"
+    except Exception:
+        return "fallback_error", "Audio error - fallback error"
+
 def get_audio_hash(filepath, hash_size=8):
     """Extracts audio properties and returns a tuple of (hash, issue_description).
-    issue_description is None if no issues, otherwise describes the fallback used."""
-    import threading
-    import queue
+    issue_description is None if no issues, otherwise describes the fallback used.
+    Only the stream info in the container header is read; no decoder is started."""
+    try:
+        infos = ffmpeg_parse_infos(filepath)
+    except Exception as e:
+        return _video_metadata_audio_hash(filepath, f"MoviePy error: {type(e).__name__}")
     
-    def load_video_clip(filepath, result_queue):
-        """Load VideoFileClip in a separate thread"""
-        try:
-            with VideoFileClip(filepath) as video_clip:
-                if video_clip.audio is None:
-                    result_queue.put(("success", "no_audio", None))  # No issue for missing audio
-                    return
-                
-                # Get basic audio properties
-                try:
-                    duration = video_clip.audio.duration
-                except Exception:
-                    duration = 0
-                
-                try:
-                    fps = video_clip.audio.fps if hasattr(video_clip.audio, 'fps') else 44100
-                except Exception:
-                    fps = 44100
-                    
-                try:
-                    nchannels = video_clip.audio.nchannels if hasattr(video_clip.audio, 'nchannels') else 2
-                except Exception:
-                    nchannels = 2
-                
-                # Create a simple hash based on duration and basic properties
-                audio_signature = f"{int(duration)}_{int(fps)}_{nchannels}"
-                
-                # Convert to a numeric hash for consistency
-                hash_value = hash(audio_signature) % (10**8)
-                result_queue.put(("success", str(hash_value), None))
-                
-        except Exception as e:
-            result_queue.put(("error", str(e), f"MoviePy error: {type(e).__name__}"))
+    if not infos.get('audio_found'):
+        return "no_audio", None  # No issue for missing audio
+    
+    # Same duration MoviePy's audio reader reported. Audio was always resampled to
+    # 44.1 kHz stereo there, so those values stay in the signature to keep it stable.
+    duration = infos.get('video_duration') or infos.get('duration') or 0
+    audio_signature = f"{int(duration)}_44100_2"
     
+    # Convert to a numeric hash for consistency
+    return str(zlib.crc32(audio_signature.encode())), None
+
+_PATH_SEPARATORS = os.sep + (os.altsep or '')
+
+def get_extension(filename):
+    """Returns the lower-cased extension (with the dot) of a file name or path, or ''.
+    A single rfind/slice instead of os.path.splitext, as it runs once per scanned file."""
+    dot = filename.rfind('.')
+    if dot <= 0 or filename[dot - 1] in _PATH_SEPARATORS:
+        return ''
+    ext = filename[dot:]
+    if any(sep in ext for sep in _PATH_SEPARATORS):
+        return ''
+    return ext.lower()
+
+def iter_media_files(root_dir):
+    """Yields (os.DirEntry, extension) pairs for the media files under root_dir.
+    Uses os.scandir so extensions are filtered on the entry name before any stat,
+    and unreadable directories are skipped just like os.walk does. Entries cache
+    their stat, so callers can read size and mtime without another syscall."""
+    pending = [root_dir]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    ext = get_extension(entry.name)
+                    if ext in MEDIA_EXTENSIONS and entry.is_file(follow_symlinks=False):
+                        yield entry, ext
+        except OSError:
+            continue
+
+def _file_digest(filepath, max_blocks=None):
+    """BLAKE2b of a file's contents, read in EXACT_MATCH_BLOCK_SIZE blocks, or None if
+    unreadable. With max_blocks only that many leading blocks are digested."""
     try:
-        # Create a queue for thread communication
-        result_queue = queue.Queue()
-        
-        # Start the video loading in a separate thread
-        thread = threading.Thread(target=load_video_clip, args=(filepath, result_queue), daemon=True)
-        thread.start()
-        thread.join(timeout=10)  # 10 second timeout
-        
-        if thread.is_alive():
-            # Thread is still running, we'll abandon it and use fallback
-            # Try alternative approach using OpenCV for basic file info
+        digest = hashlib.blake2b(digest_size=16)
+        with open(filepath, 'rb') as f:
+            blocks = 0
+            while (max_blocks is None or blocks < max_blocks) and (block := f.read(EXACT_MATCH_BLOCK_SIZE)):
+                digest.update(block)
+                blocks += 1
+        return digest.digest()
+    except OSError:
+        return None
+
+def _matching_digests(groups, digest_fn, pool):
+    """Digests every path of the groups holding two or more paths, and regroups them by
+    (group key, digest). Unreadable files are dropped; returns {new key: paths}."""
+    candidates = [(key, path) for key, paths in groups.items() if len(paths) > 1 for path in paths]
+    matches = defaultdict(list)
+    for (key, path), digest in zip(candidates, pool.map(digest_fn, (path for _, path in candidates))):
+        if digest is not None:
+            matches[(key, digest)].append(path)
+    return matches
+
+def find_exact_copies(stamps):
+    """
+    Finds files whose contents are identical to another scanned file, so only one
+    file of each set has to be decoded and hashed. Files are bucketed by media type
+    and size; only size collisions are read. Their first block is compared first, and
+    only files that still match are digested in full, so a copy is only reported when
+    the BLAKE2b digests of the whole files agree.
+    Takes {path: (size, mtime_ns)} and returns a dict mapping each copy to the
+    file whose hashes it can reuse.
+    """
+    by_size = defaultdict(list)
+    for path, (size, _) in stamps.items():
+        by_size[(get_extension(path) in VIDEO_EXTENSIONS, size)].append(path)
+    
+    # File reads and BLAKE2b both release the GIL, so candidates are digested on threads
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+        by_head = _matching_digests(by_size, lambda path: _file_digest(path, max_blocks=1), pool)
+        # Files no larger than one block were already digested whole
+        small = {key: paths for key, paths in by_head.items() if key[0][1] <= EXACT_MATCH_BLOCK_SIZE}
+        large = {key: paths for key, paths in by_head.items() if key[0][1] > EXACT_MATCH_BLOCK_SIZE}
+        identical = list(small.values()) + list(_matching_digests(large, _file_digest, pool).values())
+    
+    copy_of = {}
+    for paths in identical:
+        for path in paths[1:]:
+            copy_of[path] = paths[0]
+    return copy_of
+
+def new_process_pool(max_workers=None):
+    """Process pool whose workers are spawned rather than forked. The app starts pools
+    while Tk and helper threads are running, and forking a threaded process can deadlock."""
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker_process,
+                               mp_context=multiprocessing.get_context("spawn"))
+
+def init_worker_process():
+    """Process pool initializer. Each worker is already one of a core's worth of processes,
+    so OpenCV's own thread pool would only oversubscribe the CPU."""
+    cv2.setNumThreads(1)
+
+def run_bounded(executor, tasks, max_pending=MAX_PENDING_TASKS, restart=None, cancelled=None):
+    """
+    Submits (tag, fn, *args) tasks to executor with at most max_pending futures
+    outstanding, yielding (tag, result) pairs in completion order. Keeps memory flat
+    on huge scans instead of queuing a future for every task up front.
+    A task that raised, or was lost with a crashed worker process, yields (tag, None).
+    Once the pool is broken, restart() supplies a fresh executor for the remaining
+    tasks; without it they yield None too. Stops submitting and returns as soon as
+    cancelled() is true, leaving unfinished tasks to the executor's shutdown.
+    """
+    tasks = iter(tasks)
+    in_flight = {}
+    while True:
+        if cancelled is not None and cancelled():
+            return
+        for tag, fn, *args in itertools.islice(tasks, max_pending - len(in_flight)):
             try:
-                cap = cv2.VideoCapture(filepath)
-                if cap.isOpened():
-                    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                    fps = cap.get(cv2.CAP_PROP_FPS)
-                    duration = frame_count / fps if fps > 0 else 0
-                    cap.release()
-                    
-                    # Create a basic signature from video properties
-                    fallback_signature = f"fallback_{int(duration)}_{int(fps)}_unknown"
-                    fallback_hash = hash(fallback_signature) % (10**8)
-                    return str(fallback_hash), "Audio error"
-                else:
-                    return "opencv_error", "Audio error - OpenCV error"
+                in_flight[executor.submit(fn, *args)] = tag
+            except BrokenExecutor:
+                if restart is None:
+                    yield tag, None
+                    continue
+                executor = restart()
+                in_flight[executor.submit(fn, *args)] = tag
+        if not in_flight:
+            return
+        # With a cancel check, wake up regularly instead of waiting on a long task
+        done, _ = wait(in_flight, timeout=None if cancelled is None else 0.1, return_when=FIRST_COMPLETED)
+        for future in done:
+            tag = in_flight.pop(future)
+            try:
+                result = future.result()
             except Exception:
-                return "fallback_error", "Audio error - fallback error"
+                result = None
+            yield tag, result
+
+def _hash_one(filepath, kind, frames_to_compare):
+    """Pool worker: returns (filepath, hash) for one hash kind of a media file.
+    Lives at module level so it can be pickled into worker processes."""
+    if kind == "image":
+        return filepath, get_image_hash(filepath)
+    elif kind == "video_prefix":
+        return filepath, get_video_signature(filepath, frames_to_compare=frames_to_compare,
+                                             max_samples=VIDEO_PREFIX_FRAMES)
+    elif kind == "video":
+        return filepath, get_video_signature(filepath, frames_to_compare=frames_to_compare)
+    elif kind == "audio":
+        return filepath, get_audio_hash(filepath)
+    return filepath, None
+
+def _read_file(filepath):
+    """Returns a file's contents, or None if it can't be read."""
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _hash_chunk(jobs, frames_to_compare):
+    """Pool worker: hashes a batch of (path, kind) jobs, returning [(path, hash), ...].
+    Batching keeps inter-process overhead per task rather than per file. Image files
+    are read by a helper thread a few files ahead, so disk reads overlap decoding."""
+    image_paths = iter([path for path, kind in jobs if kind == "image"])
+    prefetched = deque()  # Reads in job order
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        def read_ahead():
+            for path in itertools.islice(image_paths, IMAGE_READ_AHEAD - len(prefetched)):
+                prefetched.append(reader.submit(_read_file, path))
+        
+        for path, kind in jobs:
+            if kind != "image":
+                results.append(_hash_one(path, kind, frames_to_compare))
+                continue
+            read_ahead()
+            data = prefetched.popleft().result()
+            read_ahead()
+            results.append((path, get_image_hash(io.BytesIO(data)) if data is not None else None))
+    return results
+
+def open_video_capture(filepath, hw_accel=False):
+    """Opens a video with OpenCV, asking FFmpeg for hardware decoding when hw_accel is set.
+    Falls back to the default backend on OpenCV builds without the acceleration properties
+    or when the accelerated open fails."""
+    if hw_accel:
+        try:
+            cap = cv2.VideoCapture(filepath, cv2.CAP_FFMPEG,
+                                   [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except (AttributeError, cv2.error, TypeError):
+            pass
+    return cv2.VideoCapture(filepath)
+
+def video_fourcc(cap):
+    """Return the upper-case FOURCC codec tag of an open capture, e.g. 'H264'."""
+    return int(cap.get(cv2.CAP_PROP_FOURCC)).to_bytes(4, 'little').decode('ascii', 'replace').upper()
+
+def raise_current_thread_priority():
+    """Best-effort bump of the calling thread's scheduling priority on Windows, where the
+    preview thread otherwise competes evenly with background thumbnail work."""
+    if os.name != 'nt': return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        THREAD_PRIORITY_ABOVE_NORMAL = 1
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL)
+    except Exception:
+        pass
+
+def frame_to_image(frame, max_size):
+    """Converts a BGR video frame to a PIL image that fits within max_size.
+    The frame is shrunk with OpenCV first, so only the small result is
+    colour-converted and copied into PIL."""
+    height, width = frame.shape[:2]
+    scale = min(max_size[0] / width, max_size[1] / height, 1.0)
+    if scale < 1.0:
+        target = (max(1, round(width * scale)), max(1, round(height * scale)))
+        frame = cv2.resize(frame, target, interpolation=cv2.INTER_AREA)
+    return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+def solid_check_sample(frame):
+    """Shrinks a BGR video frame to a small RGB array; whether a frame is a solid
+    colour barely changes at this size, and it is far cheaper to analyse."""
+    small = cv2.resize(frame, SOLID_CHECK_SIZE, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+
+def is_solid_color_image(img, threshold=0.85):
+    """True if one colour covers more than threshold of a PIL image or RGB array
+    (0.75 when that colour is near black). Colours are counted in an O(n) bincount over
+    RGB quantised to 5 bits per channel, so slight noise still counts as solid.
+    Images that are entirely near black or near white are treated as solid outright."""
+    try:
+        img_array = np.asarray(img, dtype=np.uint8)
+        if img_array.max() < 40 or img_array.min() > 215:
+            return True
+        if img_array.ndim == 3 and img_array.shape[-1] >= 3:
+            # Packed in place in one uint16 buffer, reading the channels as views
+            packed = (img_array[..., 0] >> 3).astype(np.uint16)
+            packed <<= 5
+            packed |= img_array[..., 1] >> 3
+            packed <<= 5
+            packed |= img_array[..., 2] >> 3
+            counts = np.bincount(packed.ravel(), minlength=1 << 15)
+            dominant = int(counts.argmax())
+            # Luma of the centre of the dominant colour bin
+            r, g, b = ((dominant >> 10) << 3) + 4, (((dominant >> 5) & 31) << 3) + 4, ((dominant & 31) << 3) + 4
+            dominant_value = 0.2989 * r + 0.5870 * g + 0.1140 * b
         else:
-            # Thread completed, get the result
-            try:
-                status, result, issue = result_queue.get_nowait()
-                if status == "success":
-                    return result, issue
-                else:
-                    # Fall back to OpenCV approach
-                    try:
-                        cap = cv2.VideoCapture(filepath)
-                        if cap.isOpened():
-                            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                            fps = cap.get(cv2.CAP_PROP_FPS)
-                            duration = frame_count / fps if fps > 0 else 0
-                            cap.release()
-                            
-                            fallback_signature = f"fallback_{int(duration)}_{int(fps)}_unknown"
-                            fallback_hash = hash(fallback_signature) % (10**8)
-                            return str(fallback_hash), f"Audio processing failed - used video metadata fallback ({issue})"
-                        else:
-                            return "opencv_error", "Audio error - OpenCV error"
-                    except Exception:
-                        return "fallback_error", "Audio error - fallback error"
-            except queue.Empty:
-                return "thread_error", "Audio processing failed - no result available"
-            
-    except Exception as e:
-        return "audio_error", f"Audio processing error: {type(e).__name__}"
+            gray = img_array if img_array.ndim == 2 else img_array[..., 0]
+            counts = np.bincount(gray.ravel(), minlength=256)
+            dominant_value = int(counts.argmax())
+        
+        dominant_ratio = counts.max() / counts.sum()
+        if dominant_value <= 30:
+            return dominant_ratio > 0.75
+        return dominant_ratio > threshold
+    except Exception:
+        return False
+
+def read_video_thumbnail(filepath):
+    """Returns an RGB array of the first video frame, or of a later one if the video opens
+    on a solid colour, shrunk to fit THUMBNAIL_SIZE. Runs in the thumbnail decoder processes,
+    so only the small result is sent back."""
+    cap = open_video_capture(filepath, hw_accel=True)
+    try:
+        if not cap.isOpened(): raise Exception("Could not open video file")
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if total_frames <= 0: raise Exception("Video has no frames")
+        
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        ret, frame = cap.read()
+        if not ret: raise Exception("Could not read first video frame")
+        
+        best_frame = frame
+        if is_solid_color_image(solid_check_sample(frame)) and total_frames > 1:
+            frame_positions = [total_frames // 4, total_frames // 2, total_frames * 3 // 4]
+            for pos in frame_positions:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
+                ret, frame = cap.read()
+                if ret and not is_solid_color_image(solid_check_sample(frame)):
+                    best_frame = frame
+                    break
+        return np.asarray(frame_to_image(best_frame, THUMBNAIL_SIZE))
+    finally:
+        cap.release()
+
+def prune_thumbnail_cache(max_bytes=THUMBNAIL_CACHE_MAX_BYTES):
+    """Deletes the least recently used cached thumbnails until the cache fits in max_bytes.
+    Recency is the file's mtime, which is refreshed whenever a thumbnail is reused."""
+    try:
+        with os.scandir(THUMBNAIL_CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                     for entry in entries if entry.is_file()]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            continue
+
+# --- Persistent Hash Cache ---
+def get_file_stamp(entry):
+    """Returns (size, mtime_ns) identifying the current contents of a path or
+    os.DirEntry, or None. Entries reuse the stat cached by the directory scan."""
+    try:
+        stat = entry.stat(follow_symlinks=False) if isinstance(entry, os.DirEntry) else os.stat(entry)
+        return (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        return None
+
+class HashCache:
+    """
+    SQLite-backed store of computed hashes, keyed by path and hash kind.
+    An entry is only returned while the file's size, mtime and the hashing
+    parameters still match, so modified files are always re-hashed.
+    """
+    def __init__(self, db_path=CACHE_PATH):
+        self.pending_writes = []
+        try:
+            self.conn = sqlite3.connect(db_path)
+            # WAL with relaxed syncing keeps batched commits cheap; a lost
+            # write only means that file is hashed again next time.
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT NOT NULL, kind TEXT NOT NULL, size INTEGER NOT NULL, "
+                "mtime INTEGER NOT NULL, params TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (path, kind))")
+        except sqlite3.Error:
+            self.conn = None  # Caching is best-effort; scan without it
+
+    def get(self, filepath, kind, stamp, params=""):
+        """Returns the cached value, or None if missing or stale."""
+        if self.conn is None or stamp is None:
+            return None
+        try:
+            row = self.conn.execute(
+                "SELECT value FROM hashes WHERE path = ? AND kind = ? AND size = ? AND mtime = ? AND params = ?",
+                (filepath, kind, stamp[0], stamp[1], params)).fetchone()
+            return ast.literal_eval(row[0]) if row else None
+        except (sqlite3.Error, ValueError, SyntaxError):
+            return None
+
+    def put(self, filepath, kind, stamp, value, params=""):
+        """Buffers a value; buffered values are written in one transaction per batch."""
+        if self.conn is None or stamp is None or value is None:
+            return
+        self.pending_writes.append((filepath, kind, stamp[0], stamp[1], params, repr(value)))
+        if len(self.pending_writes) >= CACHE_COMMIT_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        if self.conn is None or not self.pending_writes:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO hashes (path, kind, size, mtime, params, value) VALUES (?, ?, ?, ?, ?, ?)",
+                    self.pending_writes)
+        except sqlite3.Error:
+            pass
+        self.pending_writes = []
+
+    def close(self):
+        if self.conn is None:
+            return
+        self.flush()
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
+        self.conn = None
 
 # --- UI Helper Functions ---
 def truncate_filename_with_ext(filename, max_len=20):
@@ -215,6 +748,21 @@ def truncate_filename_with_ext(filename, max_len=20):
 
     return name[:name_len] + "..." + ext
 
+def grid_columns(container_width):
+    """Number of fixed-width thumbnail tiles that fit across a grid canvas."""
+    if container_width <= 1: container_width = 800
+    item_width = (THUMBNAIL_SIZE[0] + 10) + 10  # Fixed item frame width + grid padx
+    return max(1, container_width // item_width)
+
+def preview_canvas_size(canvas):
+    """Size of a preview canvas as last reported by its <Configure> event."""
+    return getattr(canvas, 'cached_size', None) or (canvas.winfo_width(), canvas.winfo_height())
+
+def preview_max_size(canvas):
+    """Largest image size that fits in a preview canvas with a small margin."""
+    canvas_width, canvas_height = preview_canvas_size(canvas)
+    return (canvas_width - 20, canvas_height - 20) if canvas_width > 1 and canvas_height > 1 else PREVIEW_SIZE
+
 # --- Main Application Class (Wizard Style) ---
 class DuplicateFinderWizard:
     def __init__(self, root):
@@ -227,20 +775,49 @@ class DuplicateFinderWizard:
         self.current_screen = None
         self.scan_directories = set()
         self.duplicate_groups = {}
+        self.file_meta = {}  # Filepath -> (basename, lower-cased extension) for grouped files
         self.kept_files = []
         self.checkbox_vars = {}
         self.active_media_player = None
         self.frames_to_compare = 10
+        self.image_hash_max_distance = IMAGE_HASH_MAX_DISTANCE
+        self.strict_size_match = False
         self.audio_processing_issues = {}
         self.files_selected_for_deletion = set() # Persistent selection state
+        # Latest scan progress posted by the worker, drawn by a polling loop on the Tk thread
+        self._scan_status = None
+        self._scan_status_lock = threading.Lock()
+        self._scan_status_polling = False
+        self._audio_issue_count = 0
+        # What the scanning screen currently shows, so unchanged values aren't re-configured
+        self._shown_scan_text = None
+        self._shown_scan_percentage = None
+        self._shown_audio_issue_count = 0
+        # Thumbnails are rendered off the Tk thread; only PhotoImage creation happens on it
+        self.thumbnail_executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2))
+        self.thumbnail_executor.submit(prune_thumbnail_cache)
+        # Video frames are decoded in their own processes, clear of the GIL and the Tk thread
+        self.thumbnail_decoder_pool = new_process_pool(VIDEO_THUMBNAIL_CONCURRENCY)
+        self._decoder_pool_lock = threading.Lock()  # Serializes rebuilding a crashed decoder pool
+        self._hash_pool = None  # Process pool of the running scan, see _scan_media
+        self.scan_cancelled = False  # Set when the window closes mid-scan
 
         # --- Virtualized Scrolling State ---
         self.group_keys = []
         self.group_layout_info = []
+        self.group_layout_tops = []  # Sorted 'y' of each group, for bisecting the visible range
+        self.group_layout_index = {}  # Group key -> position in group_layout_info
         self.active_group_widgets = {}
+        self.results_columns = 1  # Items per row inside each results group
         self.kept_files_layout_info = []
+        self.kept_files_columns = 1  # Items per row in the final report grid
         self.active_kept_file_widgets = {}
         self.thumbnail_widgets = {}
+        self.thumbnail_futures = {}  # Filepath -> pending or finished thumbnail load
+        self.pending_thumbnails = {}  # Filepath -> (label, canvas y) of results tiles not yet loaded
+        self.photo_cache = OrderedDict()  # Filepath -> thumbnail PhotoImage, least recently used first
+        self.preview_cache = OrderedDict()  # (filepath, max size) -> image preview PhotoImage, same order
+        self._debounce_jobs = {}  # Name -> pending root.after id, see _debounce
 
         # --- Screens ---
         self.screens = {
@@ -259,6 +836,10 @@ class DuplicateFinderWizard:
         if self.active_media_player:
             self.active_media_player.stop()
             self.active_media_player = None
+
+        # Thumbnails queued for a grid are useless once no grid is on screen
+        if screen_name not in ["results", "final_report"]:
+            self._cancel_all_thumbnails()
             
         # --- Dynamic Window Sizing ---
         if screen_name in ["results", "final_report"]:
@@ -270,8 +851,9 @@ class DuplicateFinderWizard:
             self.root.minsize(500, 220)
             self.root.resizable(True, True)
         elif screen_name == "folder_selection":
-            self.root.geometry("500x320")
-            self.root.minsize(450, 320)
+            # Leaves room for the folder list, so adding folders never resizes the window
+            self.root.geometry("500x560")
+            self.root.minsize(450, 560)
             self.root.resizable(True, True)
         else:
             self.root.geometry("600x400")
@@ -290,7 +872,7 @@ class DuplicateFinderWizard:
 
         self.list_frame = ttk.LabelFrame(frame, text="Folders to Scan")
         
-        self.folder_listbox = tk.Listbox(self.list_frame, selectmode=tk.MULTIPLE, bg="#f0f0f0", borderwidth=0, highlightthickness=0)
+        self.folder_listbox = tk.Listbox(self.list_frame, selectmode=tk.MULTIPLE, height=6, bg="#f0f0f0", borderwidth=0, highlightthickness=0)
         self.folder_scrollbar = ttk.Scrollbar(self.list_frame, orient=tk.VERTICAL, command=self.folder_listbox.yview)
         self.folder_listbox.config(yscrollcommand=self.folder_scrollbar.set)
         
@@ -300,7 +882,7 @@ class DuplicateFinderWizard:
         self.remove_folder_btn = ttk.Button(btn_frame, text="Remove Selected", command=self.remove_folder, state=tk.DISABLED)
         self.start_scan_btn = ttk.Button(btn_frame, text="Start Scan ➤", style="Accent.TButton", command=self.start_scan, state=tk.DISABLED)
         
-        settings_frame = ttk.LabelFrame(frame, text="Video Comparison Settings")
+        settings_frame = ttk.LabelFrame(frame, text="Comparison Settings")
         settings_frame.pack(pady=20, padx=20, fill='x')
         
         frames_label_frame = ttk.Frame(settings_frame)
@@ -321,20 +903,34 @@ class DuplicateFinderWizard:
                                font=("Helvetica", 9), foreground="gray")
         help_text.pack(padx=10, pady=(0, 10))
         
+        distance_label_frame = ttk.Frame(settings_frame)
+        distance_label_frame.pack(fill='x', padx=10, pady=(0, 5))
+        
+        ttk.Label(distance_label_frame, text="Image similarity tolerance (differing hash bits):", font=("Helvetica", 10)).pack(side=tk.LEFT)
+        self.distance_value_label = ttk.Label(distance_label_frame, text=f"{self.image_hash_max_distance}", font=("Helvetica", 10, "bold"))
+        self.distance_value_label.pack(side=tk.RIGHT)
+        
+        self.distance_slider = ttk.Scale(settings_frame, from_=0, to=12, orient=tk.HORIZONTAL,
+                                         command=self.on_distance_slider_change, length=300)
+        self.distance_slider.set(self.image_hash_max_distance)
+        self.distance_slider.pack(padx=10, pady=(0, 10))
+        
+        self.strict_size_var = tk.BooleanVar(value=self.strict_size_match)
+        ttk.Checkbutton(settings_frame, text="Strict size match (faster, but misses re-encoded copies)",
+                        variable=self.strict_size_var).pack(padx=10, pady=(0, 10), anchor='w')
+        
         return frame
 
     def add_folder(self):
         dir_path = filedialog.askdirectory()
         if dir_path and dir_path not in self.scan_directories:
             if not self.scan_directories:
-                self.list_frame.pack(pady=10, padx=20, fill='x', before=self.start_scan_btn.master)
-                self.folder_listbox.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=5)
+                self.list_frame.pack(pady=10, padx=20, fill='both', expand=True, before=self.start_scan_btn.master)
+                self.folder_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
                 self.folder_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
             self.scan_directories.add(dir_path)
             self.folder_listbox.insert(tk.END, dir_path)
-            self.folder_listbox.config(height=len(self.scan_directories))
-            self._resize_folder_selection_window()
             self._update_folder_buttons()
 
     def remove_folder(self):
@@ -343,28 +939,10 @@ class DuplicateFinderWizard:
             self.scan_directories.remove(self.folder_listbox.get(i))
             self.folder_listbox.delete(i)
         
-        list_size = len(self.scan_directories)
-        self.folder_listbox.config(height=list_size)
-        
-        if list_size == 0:
+        if not self.scan_directories:
             self.list_frame.pack_forget()
-        self._resize_folder_selection_window()
         self._update_folder_buttons()
 
-    def _resize_folder_selection_window(self):
-        self.root.update_idletasks()
-        base_height = 320
-        if len(self.scan_directories) > 0:
-            list_height = len(self.scan_directories) * 20 + 60
-            total_height = base_height + list_height
-        else:
-            total_height = base_height
-        min_height = 320
-        max_height = 500
-        final_height = max(min_height, min(max_height, total_height))
-        width = 500
-        self.root.geometry(f"{width}x{final_height}")
-
     def _update_folder_buttons(self):
         if self.scan_directories:
             self.remove_folder_btn.pack(side=tk.LEFT, padx=10)
@@ -379,16 +957,25 @@ class DuplicateFinderWizard:
         self.frames_to_compare = int(float(value))
         self.frames_value_label.config(text=f"{self.frames_to_compare}")
 
+    def on_distance_slider_change(self, value):
+        self.image_hash_max_distance = int(float(value))
+        self.distance_value_label.config(text=f"{self.image_hash_max_distance}")
+
     def start_scan(self):
         if not self.scan_directories:
             messagebox.showwarning("No Folders", "Please add at least one folder to scan.")
             return
 
+        # Tk variables must not be read from the scan thread
+        self.strict_size_match = self.strict_size_var.get()
+        
         # Reset selections from any previous scan
         self.files_selected_for_deletion.clear()
         self.checkbox_vars.clear()
 
         self.show_screen("scanning")
+        self._scan_status_polling = True
+        self._poll_scan_status()
         threading.Thread(target=self.scan_thread, daemon=True).start()
 
     # --- Screen 2: Scanning ---
@@ -414,95 +1001,282 @@ class DuplicateFinderWizard:
         return frame
 
     def scan_thread(self):
+        """Runs the scan on its worker thread. The final status and the hand-back to the
+        Tk thread always happen, so a failed scan never leaves the scanning screen stuck."""
+        self.scan_error = None
+        try:
+            self._scan_media()
+        except Exception as e:
+            self.scan_error = str(e) or type(e).__name__
+        finally:
+            if self.scan_cancelled:
+                return  # The window is gone; there is nothing left to report to
+            final_status = "Scan failed!" if self.scan_error else "Scan complete!"
+            if self.audio_processing_issues:
+                issue_count = len(self.audio_processing_issues)
+                final_status += f" (Note: {issue_count} file(s) had audio processing issues)"
+            if getattr(self, 'crashed_files', None):
+                final_status += f" (Skipped {len(self.crashed_files)} file(s) that crashed the decoder)"
+            
+            self._post_scan_status(final_status, 100)
+            self.root.after(0, self.on_scan_complete)
+
+    def _scan_media(self):
         self.duplicate_groups.clear()
         self.audio_processing_issues.clear()
-        filepaths = [os.path.join(r, f) for d in self.scan_directories for r, _, fs in os.walk(d) for f in fs]
-        total = len(filepaths)
+        self.crashed_files = set()  # Files that kill a hash worker; left out of the results
+        self._audio_issue_count = 0
+        # One stat per file, taken from the directory scan, serves every pass below
+        stamps = {}
+        extensions = {}  # Path -> extension, as found by the directory scan
+        for d in self.scan_directories:
+            for entry, ext in iter_media_files(d):
+                stamp = get_file_stamp(entry)
+                if stamp is not None:
+                    stamps[entry.path] = stamp
+                    extensions[entry.path] = ext
+        if self.strict_size_match:
+            # Only files sharing their exact size and extension with another file are hashed
+            size_counts = Counter((extensions[path], stamp[0]) for path, stamp in stamps.items())
+            stamps = {path: stamp for path, stamp in stamps.items()
+                      if size_counts[(extensions[path], stamp[0])] > 1}
+        filepaths = list(stamps)
         
         self.scan_overall_progress_bar['maximum'] = 100
-        hashes = {}
-        for i, path in enumerate(filepaths):
-            overall_progress = (i / total) * 75
-            self.root.after(0, lambda p=path, n=i, op=overall_progress: 
-                self.update_scan_status(f"Processing visuals ({n+1}/{total}): {os.path.basename(p)}", op))
+        # Exact copies reuse the hashes of their original instead of being decoded again
+        self._post_scan_status("Checking for exact copies...", 0)
+        copy_of = find_exact_copies(stamps)
+        copies = defaultdict(list)
+        for copy, original in copy_of.items():
+            copies[original].append(copy)
+        cache = HashCache()
+        # Cached hashes are only reused when computed with the same settings
+        video_params = f"{self.frames_to_compare}:{HASH_ALGORITHM}"
+        # With few frames per video the prefix already covers every sample
+        video_pass_kind = "video_prefix" if self.frames_to_compare > VIDEO_PREFIX_FRAMES else "video"
+        
+        # Pass 1: full hashes for images, a few-frame prefix signature for videos.
+        # The same pool is reused for every pass below.
+        jobs = []
+        for path in filepaths:
+            if path in copy_of:
+                continue
+            if extensions[path] in VIDEO_EXTENSIONS:
+                jobs.append((path, video_pass_kind, video_params))
+            else:
+                jobs.append((path, "image", HASH_ALGORITHM))
+        self._hash_pool = new_process_pool()
+        try:
+            results = self._run_hash_jobs(cache, stamps, jobs, 0, 60, "Processed visuals")
+            
+            hashes = defaultdict(list)
+            video_prefixes = defaultdict(list)
+            for (path, kind), h in results.items():
+                target = video_prefixes if kind == "video_prefix" else hashes
+                target[h].append(path)
+                target[h].extend(copies[path])
+            
+            # Pass 2: only videos that share a prefix can be duplicates, so only
+            # those pay for sampling the full set of frames. The audio hash is
+            # taken by the same worker right after, while the file is still cached.
+            # Groups made only of one video and its exact copies are already settled.
+            jobs = []
+            for prefix, paths in video_prefixes.items():
+                originals = [path for path in paths if path not in copy_of]
+                if len(originals) > 1:
+                    for path in originals:
+                        jobs.append((path, "video", video_params))
+                        jobs.append((path, "audio", ""))
+                elif len(paths) > 1:
+                    hashes[prefix] = paths
+            results = self._run_hash_jobs(cache, stamps, jobs, 60, 90, "Processed full video signatures")
+            audio_results = {}
+            for (path, kind), h in results.items():
+                if kind == "audio":
+                    audio_results[path] = h
+                else:
+                    hashes[h].append(path)
+                    hashes[h].extend(copies[path])
             
-            ext = os.path.splitext(path)[1].lower()
-            h = None
-            if ext in IMAGE_EXTENSIONS:
-                h = get_image_hash(path)
-            elif ext in VIDEO_EXTENSIONS:
-                h = get_video_signature(path, frames_to_compare=self.frames_to_compare)
+            # Perceptual hashes of near-identical images can differ by a few bits,
+            # so merge image groups by Hamming distance rather than exact equality.
+            self._post_scan_status("Grouping similar images...", 90)
+            image_hashes = {k: v for k, v in hashes.items() if isinstance(k, tuple)}
+            hashes = {k: v for k, v in hashes.items() if not isinstance(k, tuple)}
+            hashes.update(group_similar_image_hashes(image_hashes, self.image_hash_max_distance))
             
-            if h:
-                if h not in hashes: hashes[h] = []
-                hashes[h].append(path)
+            visual_duplicate_groups = {k: v for k, v in hashes.items() if len(v) > 1}
             
-            overall_progress = ((i + 1) / total) * 75
-            self.root.after(0, lambda p=path, n=i, op=overall_progress: 
-                self.update_scan_status(f"Completed visuals ({n+1}/{total}): {os.path.basename(p)}", op))
+            # Video signatures are bytes and image hashes are tuples, so a group's
+            # media type follows from its key without re-inspecting every path.
+            video_paths = [p for visual_hash, paths in visual_duplicate_groups.items()
+                           if isinstance(visual_hash, bytes) for p in paths]
+            # Exact copies share their original's audio, which is in the same group
+            video_paths = [p for p in video_paths if p not in copy_of]
+            
+            # Audio for duplicated videos that skipped pass 2: every video when the
+            # first pass already sampled all frames, or one video and its copies.
+            jobs = [(path, "audio", "") for path in video_paths if path not in audio_results]
+            results = self._run_hash_jobs(cache, stamps, jobs, 90, 100, "Processed audio")
+            audio_results.update((path, h) for (path, _), h in results.items())
+        finally:
+            self._hash_pool.shutdown(wait=False, cancel_futures=True)
+            cache.close()
         
-        visual_duplicate_groups = {k: v for k, v in hashes.items() if len(v) > 1}
         final_duplicate_groups = {}
-        group_counter = 0
-        total_video_files = sum(len(paths) for paths in visual_duplicate_groups.values() 
-                                if any(os.path.splitext(p)[1].lower() in VIDEO_EXTENSIONS for p in paths))
-        processed_video_files = 0
-        
         for visual_hash, paths in visual_duplicate_groups.items():
-            is_video_group = any(os.path.splitext(p)[1].lower() in VIDEO_EXTENSIONS for p in paths)
-
-            if is_video_group:
-                audio_groups = {}
-                for i, path in enumerate(paths):
-                    overall_progress = 75 + (processed_video_files / max(1, total_video_files)) * 25
-                    self.root.after(0, lambda p=path, n=i, op=overall_progress: 
-                        self.update_scan_status(f"Processing audio for group {group_counter+1} ({n+1}/{len(paths)}): {os.path.basename(p)}", op))
-                    
-                    audio_h, audio_issue = get_audio_hash(path)
-                    if audio_issue:
-                        self.audio_processing_issues[path] = audio_issue
-                        issue_count = len(self.audio_processing_issues)
-                        self.root.after(0, self.update_audio_issues_counter, issue_count)
-
-                    if audio_h not in audio_groups:
-                        audio_groups[audio_h] = []
-                    audio_groups[audio_h].append(path)
-                    
-                    processed_video_files += 1
+            if isinstance(visual_hash, bytes):
+                audio_groups = defaultdict(list)
+                for path in paths:
+                    audio = audio_results.get(copy_of.get(path, path))
+                    if audio is not None:  # Videos whose audio was lost to a crashed worker stay ungrouped
+                        audio_groups[audio[0]].append(path)
 
                 for audio_hash, audio_paths in audio_groups.items():
                     if len(audio_paths) > 1:
-                        final_group_key = f"{visual_hash}_{audio_hash}"
-                        final_duplicate_groups[final_group_key] = audio_paths
+                        # A tuple key avoids formatting the whole signature into a string
+                        final_duplicate_groups[(visual_hash, audio_hash)] = audio_paths
             else:
                 final_duplicate_groups[visual_hash] = paths
-            group_counter += 1
             
-        self.duplicate_groups = final_duplicate_groups
-        for key in self.duplicate_groups:
-            self.duplicate_groups[key].sort(key=lambda path: self.get_file_creation_time(path))
+        for paths in final_duplicate_groups.values():
+            paths.sort(key=lambda path: self.get_file_creation_time(path))
+        # Ordered once here, largest groups first, so the results screen just follows dict order
+        self.duplicate_groups = dict(sorted(final_duplicate_groups.items(),
+                                            key=lambda item: len(item[1]), reverse=True))
+        # Parsed once here so the results and report screens don't re-split paths on every redraw
+        self.file_meta = {
+            path: (os.path.basename(path), extensions[path])
+            for paths in self.duplicate_groups.values() for path in paths
+        }
 
-        final_status = "Scan complete!"
-        if self.audio_processing_issues:
-            issue_count = len(self.audio_processing_issues)
-            final_status += f" (Note: {issue_count} file(s) had audio processing issues)"
-        
-        self.root.after(0, lambda: self.update_scan_status(final_status, 100))
-        self.root.after(0, self.on_scan_complete)
+    def get_file_meta(self, filepath):
+        """Returns (basename, lower-cased extension), parsing paths missing from file_meta."""
+        meta = self.file_meta.get(filepath)
+        if meta is None:
+            meta = (os.path.basename(filepath), get_extension(filepath))
+        return meta
+
+    def _restart_hash_pool(self):
+        """Replaces a hash pool broken by a crashed worker process (e.g. a decoder
+        segfault on a corrupt file) so the rest of the scan can continue."""
+        self._hash_pool.shutdown(wait=False, cancel_futures=True)
+        self._hash_pool = new_process_pool()
+        return self._hash_pool
+
+    def _run_hash_jobs(self, cache, stamps, jobs, progress_start, progress_end, label):
+        """Hashes (path, kind, params) jobs on the hash pool, reusing cached results.
+        Returns {(path, kind): hash} for every job that produced a hash. Batches lost
+        to a crashed worker are retried file by file; only files that crash a worker
+        on their own are left unhashed, and are added to crashed_files."""
+        results = {}
+        pending = []
+        for path, kind, params in jobs:
+            stamp = stamps[path]
+            h = cache.get(path, kind, stamp, params)
+            if h is None:
+                pending.append((path, kind, stamp, params))
+            elif kind == "audio":
+                results[(path, kind)] = (h, None)  # Only issue-free audio hashes are cached
+            else:
+                results[(path, kind)] = h
+        
+        # Shard the work so each task carries many files, but keep enough tasks
+        # in flight for every core to stay busy on small scans.
+        total = len(jobs)
+        chunk_size = max(1, min(HASH_CHUNK_SIZE, len(pending) // MAX_PENDING_TASKS))
+        chunks = (pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size))
+        tasks = ((chunk, _hash_chunk, [(path, kind) for path, kind, _, _ in chunk], self.frames_to_compare)
+                 for chunk in chunks)
+        
+        done = total - len(pending)
+        def record(chunk, chunk_results):
+            nonlocal done
+            for (path, h), (_, kind, stamp, params) in zip(chunk_results, chunk):
+                if h:
+                    results[(path, kind)] = h
+                    if kind != "audio":
+                        cache.put(path, kind, stamp, h, params)
+                    elif h[1] is None:
+                        # Audio fallback results may be transient, so only clean ones are kept
+                        cache.put(path, kind, stamp, h[0], params)
+                    else:
+                        # Recorded as they arrive, so the scanning screen can report them live
+                        if path not in self.audio_processing_issues:
+                            self._audio_issue_count += 1
+                        self.audio_processing_issues[path] = h[1]
+            done += len(chunk)
+            
+            overall_progress = progress_start + (done / total) * (progress_end - progress_start)
+            self._post_scan_status(label, overall_progress, (done, total, chunk[-1][0]))
+        
+        # A crashed worker takes every batch in flight down with it. Lost batches are
+        # retried one file per task, and files lost again are retried one at a time,
+        # so only a file that crashes a worker by itself is dropped.
+        failed = []
+        for max_pending in (MAX_PENDING_TASKS, MAX_PENDING_TASKS, 1):
+            for chunk, chunk_results in run_bounded(self._hash_pool, tasks, max_pending,
+                                                    restart=self._restart_hash_pool,
+                                                    cancelled=lambda: self.scan_cancelled):
+                if chunk_results is None:
+                    failed.extend(chunk)
+                else:
+                    record(chunk, chunk_results)
+            tasks = [([job], _hash_chunk, [job[:2]], self.frames_to_compare) for job in failed]
+            failed = []
+        if self.scan_cancelled:
+            return results
+        for chunk, _, _, _ in tasks:
+            self.crashed_files.add(chunk[0][0])
+            record(chunk, [])
+        return results
+
+    def _post_scan_status(self, label, overall_progress, item=None):
+        """Records the latest scan progress from the worker thread. Only the newest
+        status is kept; optional (done, total, path) item details are formatted
+        when drawn, so per-file posts cost no Tk callback or string building."""
+        with self._scan_status_lock:
+            self._scan_status = (label, overall_progress, item)
+
+    def _poll_scan_status(self):
+        """Draws the latest posted scan status and audio issue count, repeating while
+        the scan is running."""
+        with self._scan_status_lock:
+            status, self._scan_status = self._scan_status, None
+        if status is not None:
+            label, overall_progress, item = status
+            if item is not None:
+                done, total, path = item
+                label = f"{label} ({done}/{total}): {os.path.basename(path)}"
+            self.update_scan_status(label, overall_progress)
+        
+        count = self._audio_issue_count
+        if count != self._shown_audio_issue_count:
+            self._shown_audio_issue_count = count
+            text = f"⚠️ {count} file(s) with audio processing issues" if count > 0 else ""
+            self.scan_audio_issues_label.config(text=text)
+        if self._scan_status_polling:
+            self.root.after(SCAN_STATUS_POLL_MS, self._poll_scan_status)
 
     def update_scan_status(self, text, overall_percentage):
-        self.scan_status_label.config(text=text)
-        self.scan_overall_progress_bar['value'] = overall_percentage
-        self.scan_overall_percentage.config(text=f"{overall_percentage:.1f}%")
-
-    def update_audio_issues_counter(self, count):
-        if count > 0:
-            text = f"⚠️ {count} file(s) with audio processing issues"
-            self.scan_audio_issues_label.config(text=text)
-        else:
-            self.scan_audio_issues_label.config(text="")
+        # Every configure makes Tk redraw the widget, so only changed values are set
+        if text != self._shown_scan_text:
+            self._shown_scan_text = text
+            self.scan_status_label.config(text=text)
+        percentage_text = f"{overall_percentage:.1f}%"
+        if percentage_text != self._shown_scan_percentage:
+            self._shown_scan_percentage = percentage_text
+            self.scan_overall_progress_bar['value'] = overall_percentage
+            self.scan_overall_percentage.config(text=percentage_text)
 
     def on_scan_complete(self):
+        # Stop polling after drawing whatever status the scan posted last
+        self._scan_status_polling = False
+        self._poll_scan_status()
+        if self.scan_error:
+            messagebox.showerror("Scan Failed", f"The scan stopped because of an error:\n{self.scan_error}")
+            self.close_app()
+            return
         if not self.duplicate_groups:
             messagebox.showinfo("Scan Complete", "No duplicate files were found.")
             self.close_app()
@@ -562,7 +1336,7 @@ class DuplicateFinderWizard:
         self.results_scrollbar.pack(side="right", fill="y")
         
         # Re-calculate layout on resize
-        self.canvas_scroll_frame.bind("<Configure>", lambda e: self.root.after_idle(self.prepare_virtualized_results, True))
+        self.canvas_scroll_frame.bind("<Configure>", lambda e: self._debounce("results_layout", GRID_RELAYOUT_DELAY_MS, self._on_results_resized))
         self.canvas_scroll_frame.bind_all("<MouseWheel>", self._on_mousewheel)
 
         footer = ttk.Frame(frame)
@@ -591,6 +1365,14 @@ class DuplicateFinderWizard:
         """Called on any scroll action on the results canvas. Schedules a widget update."""
         self.root.after_idle(self._update_visible_groups)
 
+    def _on_results_resized(self):
+        """Re-lays out the groups only if the number of columns changed; otherwise
+        just refreshes which groups are visible."""
+        if grid_columns(self.canvas_scroll_frame.winfo_width()) != self.results_columns:
+            self.prepare_virtualized_results(True)
+        else:
+            self._update_visible_groups()
+
     def prepare_virtualized_results(self, re_layout=False):
         """Pre-calculates the layout and height of all groups to set up the virtualized view."""
         if not re_layout:
@@ -600,8 +1382,11 @@ class DuplicateFinderWizard:
         for widget_id in self.active_group_widgets.values():
             self.canvas_scroll_frame.delete(widget_id)
         self.active_group_widgets.clear()
+        self._cancel_all_thumbnails()
         
         self.group_layout_info.clear()
+        self.group_layout_tops.clear()
+        self.group_layout_index.clear()
         current_y = 0
         
         container_width = self.canvas_scroll_frame.winfo_width()
@@ -610,10 +1395,8 @@ class DuplicateFinderWizard:
         # Fixed height for one row of items inside a group frame
         ITEM_ROW_HEIGHT = (THUMBNAIL_SIZE[1] + 80) + 10 # (Fixed Item Frame Height) + grid pady
         
-        # Width of one item including padding
-        ITEM_WIDTH = (THUMBNAIL_SIZE[0] + 10) + 10 # (Fixed Item Frame width) + grid padx
-
-        max_cols = max(1, container_width // ITEM_WIDTH)
+        max_cols = grid_columns(container_width)
+        self.results_columns = max_cols
         
         GROUP_HEADER_HEIGHT = 40 # Estimated height for the LabelFrame border and text
         GROUP_MARGIN = 15 # Consistent margin between groups
@@ -624,7 +1407,9 @@ class DuplicateFinderWizard:
             group_height = (num_rows * ITEM_ROW_HEIGHT) + GROUP_HEADER_HEIGHT
             
             # The 'y' position is the running total before adding the current group
+            self.group_layout_index[key] = len(self.group_layout_info)
             self.group_layout_info.append({'y': current_y, 'height': group_height, 'key': key})
+            self.group_layout_tops.append(current_y)
             
             # Increment the running total for the *next* group's position
             current_y += group_height + GROUP_MARGIN
@@ -654,9 +1439,12 @@ class DuplicateFinderWizard:
         render_top = max(0, view_top - buffer)
         render_bottom = min(total_height, view_bottom + buffer)
         
+        # Groups are laid out top to bottom, so the rendered ones are a contiguous slice
+        first = max(0, bisect.bisect_right(self.group_layout_tops, render_top) - 1)
+        last = bisect.bisect_left(self.group_layout_tops, render_bottom)
         visible_keys = {
-            info['key'] for info in self.group_layout_info 
-            if info['y'] + info['height'] > render_top and info['y'] < render_bottom
+            info['key'] for info in self.group_layout_info[first:last]
+            if info['y'] + info['height'] > render_top
         }
         
         rendered_keys = set(self.active_group_widgets.keys())
@@ -682,26 +1470,33 @@ class DuplicateFinderWizard:
                  self.checkbox_vars.pop(path, None)
             for path in self.duplicate_groups.get(key, []):
                  self.thumbnail_widgets.pop(path, None)
+                 self.pending_thumbnails.pop(path, None)
+                 self._cancel_thumbnail(path)
 
         for key in to_create:
-            info = next((i for i in self.group_layout_info if i['key'] == key), None)
-            if info:
-                group_widget = self._create_group_widget(key)
-                widget_id = self.canvas_scroll_frame.create_window(0, info['y'], window=group_widget, anchor="nw")
-                self.active_group_widgets[key] = widget_id
+            info = self.group_layout_info[self.group_layout_index[key]]
+            group_widget = self._create_group_widget(key)
+            widget_id = self.canvas_scroll_frame.create_window(0, info['y'], window=group_widget, anchor="nw")
+            self.active_group_widgets[key] = widget_id
+
+        # Large groups can reach far outside the view, so thumbnails are loaded per row
+        ITEM_ROW_HEIGHT = (THUMBNAIL_SIZE[1] + 80) + 10
+        for path, (label, item_y) in list(self.pending_thumbnails.items()):
+            if item_y + ITEM_ROW_HEIGHT > render_top and item_y < render_bottom:
+                del self.pending_thumbnails[path]
+                self._queue_thumbnail(path, label)
 
     def _create_group_widget(self, key):
         """Creates the widget for a single duplicate group with a fixed, predictable layout."""
         paths = self.duplicate_groups[key]
-        group_index = self.group_keys.index(key)
+        group_index = self.group_layout_index[key]
         
         group_frame = ttk.LabelFrame(self.canvas_scroll_frame, text=f"Group {group_index + 1} ({len(paths)} items)")
 
-        container_width = self.canvas_scroll_frame.winfo_width()
-        if container_width <= 1: container_width = 800
-
-        ITEM_WIDTH = (THUMBNAIL_SIZE[0] + 10) + 10
-        max_cols = max(1, container_width // ITEM_WIDTH)
+        max_cols = self.results_columns
+        group_y = self.group_layout_info[group_index]['y']
+        ITEM_ROW_HEIGHT = (THUMBNAIL_SIZE[1] + 80) + 10
+        GROUP_LABEL_HEIGHT = 20 # Estimated height of the LabelFrame text above the first row
 
         for j, filepath in enumerate(paths):
             row, col = divmod(j, max_cols)
@@ -732,7 +1527,7 @@ class DuplicateFinderWizard:
             self.thumbnail_widgets[filepath] = thumb_label
 
             # Truncate long filenames, keeping the extension visible
-            filename = truncate_filename_with_ext(os.path.basename(filepath))
+            filename = truncate_filename_with_ext(self.get_file_meta(filepath)[0])
             filename_label = ttk.Label(item_frame, text=filename, anchor="center")
             filename_label.pack(fill='x', expand=True, pady=2)
             
@@ -743,7 +1538,8 @@ class DuplicateFinderWizard:
                 issue_label = tk.Label(item_frame, text=f"⚠️ {issue_text}", fg='orange', font=('Arial', 8))
                 issue_label.pack(pady=(0, 2))
             
-            threading.Thread(target=self.load_thumbnail, args=(filepath, thumb_label), daemon=True).start()
+            # Loaded by _update_visible_groups once the row is near the view
+            self.pending_thumbnails[filepath] = (thumb_label, group_y + GROUP_LABEL_HEIGHT + row * ITEM_ROW_HEIGHT)
         
         return group_frame
 
@@ -770,7 +1566,7 @@ class DuplicateFinderWizard:
         preview_widgets['video_controls'].pack_forget()
         preview_widgets['gif_controls'].pack_forget()
 
-        ext = os.path.splitext(filepath)[1].lower()
+        ext = self.get_file_meta(filepath)[1]
         if ext == '.gif':
             preview_widgets['gif_controls'].pack(fill='x', pady=5)
             self.active_media_player = GifPlayer(filepath, preview_widgets['canvas'], preview_widgets['gif_play'])
@@ -785,102 +1581,137 @@ class DuplicateFinderWizard:
 
     def display_image_preview(self, filepath, canvas):
         try:
-            img = Image.open(filepath)
-            canvas.update_idletasks()
-            canvas_width = canvas.winfo_width()
-            canvas_height = canvas.winfo_height()
-            
-            max_size = (canvas_width - 20, canvas_height - 20) if canvas_width > 1 and canvas_height > 1 else PREVIEW_SIZE
-            
-            img.thumbnail(max_size, Image.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
+            max_size = preview_max_size(canvas)
+            photo = self.preview_cache.get((filepath, max_size))
+            if photo is None:
+                with Image.open(filepath) as img:
+                    img.thumbnail(max_size, Image.LANCZOS)
+                    photo = ImageTk.PhotoImage(img)
+            self._cache_photo(self.preview_cache, (filepath, max_size), photo, PREVIEW_CACHE_SIZE)
+            canvas_width, canvas_height = preview_canvas_size(canvas)
             canvas.delete("all")
-            canvas.create_image(canvas.winfo_width()/2, canvas.winfo_height()/2, anchor='center', image=photo)
+            canvas.create_image(canvas_width/2, canvas_height/2, anchor='center', image=photo)
             canvas.image = photo
         except Exception:
+            canvas_width, canvas_height = preview_canvas_size(canvas)
             canvas.delete("all")
-            canvas.create_text(canvas.winfo_width()/2, canvas.winfo_height()/2, text="Preview not available", fill="red")
+            canvas.create_text(canvas_width/2, canvas_height/2, text="Preview not available", fill="red")
+
+    def _debounce(self, name, delay_ms, callback, *args):
+        """Runs callback delay_ms after the most recent call made under the same name."""
+        job = self._debounce_jobs.pop(name, None)
+        if job is not None: self.root.after_cancel(job)
+        self._debounce_jobs[name] = self.root.after(delay_ms, self._run_debounced, name, callback, args)
+
+    def _run_debounced(self, name, callback, args):
+        self._debounce_jobs.pop(name, None)
+        callback(*args)
+
+    def _queue_thumbnail(self, filepath, label):
+        """Queues a thumbnail load on the pool, replacing any pending load for the file.
+        Thumbnails still held in photo_cache are shown straight away instead."""
+        self._cancel_thumbnail(filepath)
+        photo = self.photo_cache.get(filepath)
+        if photo is not None:
+            self._cache_photo(self.photo_cache, filepath, photo, PHOTO_CACHE_SIZE)
+            label.config(image=photo, width=0, height=0)
+            label.image = photo
+            return
+        self.thumbnail_futures[filepath] = self.thumbnail_executor.submit(self.load_thumbnail, filepath, label)
 
-    def is_solid_color_image(self, img, threshold=0.85):
-        try:
-            img_array = np.array(img)
-            height, width = img_array.shape[:2]
-            total_pixels = height * width
-            
-            if len(img_array.shape) == 2:
-                unique_values, counts = np.unique(img_array, return_counts=True)
-            elif img_array.shape[-1] >= 3:
-                gray = np.dot(img_array[...,:3], [0.2989, 0.5870, 0.1140])
-                unique_values, counts = np.unique(gray.astype(np.uint8), return_counts=True)
-            else:
-                unique_values, counts = np.unique(img_array, return_counts=True)
-                
-            max_count = np.max(counts)
-            dominant_ratio = max_count / total_pixels
-            
-            if len(unique_values) > 0:
-                most_common_value = unique_values[np.argmax(counts)]
-                if most_common_value <= 30:
-                    return dominant_ratio > 0.75
-            
-            return dominant_ratio > threshold
-        except Exception:
-            return False
+    def _cancel_thumbnail(self, filepath):
+        """Drops a queued thumbnail load whose tile is gone; running loads just finish."""
+        future = self.thumbnail_futures.pop(filepath, None)
+        if future is not None:
+            future.cancel()
+
+    def _cancel_all_thumbnails(self):
+        for future in self.thumbnail_futures.values():
+            future.cancel()
+        self.thumbnail_futures.clear()
+        self.pending_thumbnails.clear()
 
     def load_thumbnail(self, filepath, label):
+        """Thumbnail pool worker: renders a thumbnail, or loads it from the disk cache,
+        and hands it to the Tk thread, which creates the PhotoImage."""
         try:
             # Check if the widget still exists before processing
             if not label.winfo_exists():
                 return
-                
-            ext = os.path.splitext(filepath)[1].lower()
-            if ext in IMAGE_EXTENSIONS:
-                img = Image.open(filepath)
-            elif ext in VIDEO_EXTENSIONS:
-                cv2.setLogLevel(0)
-                cap = cv2.VideoCapture(filepath)
-                if not cap.isOpened(): raise Exception("Could not open video file")
-                
-                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                if total_frames <= 0:
-                    cap.release()
-                    raise Exception("Video has no frames")
-                
-                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                ret, frame = cap.read()
-                if not ret:
-                    cap.release()
-                    raise Exception("Could not read first video frame")
-                
-                first_frame_img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                
-                if self.is_solid_color_image(first_frame_img) and total_frames > 1:
-                    frame_positions = [total_frames // 4, total_frames // 2, total_frames * 3 // 4]
-                    best_frame = first_frame_img
-                    for pos in frame_positions:
-                        cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
-                        ret, frame = cap.read()
-                        if ret:
-                            candidate_img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                            if not self.is_solid_color_image(candidate_img):
-                                best_frame = candidate_img
-                                break
-                    img = best_frame
-                else:
-                    img = first_frame_img
-                
-                cap.release()
             
-            img.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
+            # Cached thumbnails are keyed by path, size and mtime, so edits invalidate them
+            stamp = get_file_stamp(filepath)
+            cache_path = None
+            img = None
+            if stamp is not None:
+                key = f"{filepath}|{stamp[0]}|{stamp[1]}|{THUMBNAIL_SIZE}".encode()
+                cache_path = os.path.join(THUMBNAIL_CACHE_DIR, hashlib.sha1(key).hexdigest() + ".png")
+                try:
+                    with Image.open(cache_path) as cached:
+                        img = cached.copy()
+                    os.utime(cache_path)  # Mark as recently used for pruning
+                except OSError:
+                    pass
             
-            # Check widget existence again before updating UI from thread
-            if label.winfo_exists():
-                self.root.after(0, lambda: label.config(image=photo, width=0, height=0))
-                label.image = photo 
+            if img is None:
+                img = self.render_thumbnail(filepath)
+                if cache_path is not None:
+                    try:
+                        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+                        img.save(cache_path, "PNG")
+                    except (OSError, ValueError):
+                        pass  # Caching is best-effort
+            
+            self.root.after(0, self._show_thumbnail, filepath, label, img)
         except Exception:
-            if label.winfo_exists():
-                self.root.after(0, lambda: label.config(text="Error", bg="red"))
+            self.root.after(0, self._show_thumbnail, filepath, label, None)
+
+    def _show_thumbnail(self, filepath, label, img):
+        if not label.winfo_exists():
+            return
+        if img is None:
+            label.config(text="Error", bg="red")
+            return
+        photo = ImageTk.PhotoImage(img)
+        label.config(image=photo, width=0, height=0)
+        label.image = photo
+        self._cache_photo(self.photo_cache, filepath, photo, PHOTO_CACHE_SIZE)
+
+    @staticmethod
+    def _cache_photo(cache, key, photo, max_entries):
+        """Stores photo as the most recently used entry of an LRU OrderedDict."""
+        cache[key] = photo
+        cache.move_to_end(key)
+        if len(cache) > max_entries:
+            cache.popitem(last=False)
+
+    def render_thumbnail(self, filepath):
+        """Decodes a file into a PIL thumbnail, skipping solid-colour opening frames of videos."""
+        ext = self.get_file_meta(filepath)[1]
+        if ext in IMAGE_EXTENSIONS:
+            img = Image.open(filepath)
+            img.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
+        elif ext in VIDEO_EXTENSIONS:
+            img = Image.fromarray(self._decode_video_thumbnail(filepath))
+        else:
+            raise Exception("Unsupported file type")
+        return img
+
+    def _decode_video_thumbnail(self, filepath):
+        """Runs read_video_thumbnail on the decoder pool. A decoder process that crashes
+        breaks the pool for every thumbnail, so it is rebuilt and the file retried once;
+        a file that breaks the fresh pool too is the one that crashes the decoder."""
+        for _ in range(2):
+            pool = self.thumbnail_decoder_pool
+            try:
+                return pool.submit(read_video_thumbnail, filepath).result()
+            except BrokenExecutor:
+                with self._decoder_pool_lock:
+                    # Only the first thread to notice rebuilds; the others reuse its pool
+                    if self.thumbnail_decoder_pool is pool:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        self.thumbnail_decoder_pool = new_process_pool(VIDEO_THUMBNAIL_CONCURRENCY)
+        raise Exception("Video decoder crashed")
 
     def set_all_checkboxes(self, select_all):
         """Updates the master selection set and all visible checkboxes."""
@@ -901,7 +1732,8 @@ class DuplicateFinderWizard:
     def start_deletion(self):
         """Starts the deletion process using the persistent selection set."""
         # The set is now the single source of truth.
-        self.files_to_delete = list(self.files_selected_for_deletion)
+        # Grouped by directory so each folder's entries are removed together
+        self.files_to_delete = sorted(self.files_selected_for_deletion, key=os.path.split)
         
         if not self.files_to_delete:
             messagebox.showwarning("No Selection", "No files selected for deletion.")
@@ -931,28 +1763,29 @@ class DuplicateFinderWizard:
 
     def delete_thread(self):
         all_files = [p for group in self.duplicate_groups.values() for p in group]
-        self.kept_files = [p for p in all_files if p not in self.files_to_delete]
+        to_delete = set(self.files_to_delete)
+        self.kept_files = [p for p in all_files if p not in to_delete]
         self.kept_files.sort(key=lambda path: self.get_file_creation_time(path))
 
 
         total = len(self.files_to_delete)
         self.delete_overall_progress_bar['maximum'] = 100
         
+        # Updates are throttled so a large deletion doesn't flood Tk's event queue
+        last_update = 0.0
         for i, path in enumerate(self.files_to_delete):
-            overall_percentage = (i / max(1, total)) * 100
-            
-            self.root.after(0, lambda p=path, n=i, op=overall_percentage: 
-                self.update_delete_status(f"Deleting ({n+1}/{total}): {os.path.basename(p)}", op))
-            
             try:
                 os.remove(path)
-                overall_percentage = ((i + 1) / max(1, total)) * 100
-                self.root.after(0, lambda p=path, n=i, op=overall_percentage: 
-                    self.update_delete_status(f"Deleted ({n+1}/{total}): {os.path.basename(p)}", op))
+                status = "Deleted"
             except OSError:
+                status = "Failed to delete"
+            
+            now = time.monotonic()
+            if now - last_update >= DELETE_STATUS_INTERVAL or i == total - 1:
+                last_update = now
                 overall_percentage = ((i + 1) / max(1, total)) * 100
-                self.root.after(0, lambda p=path, n=i, op=overall_percentage: 
-                    self.update_delete_status(f"Failed to delete ({n+1}/{total}): {os.path.basename(p)}", op))
+                self.root.after(0, self.update_delete_status,
+                                f"{status} ({i+1}/{total}): {os.path.basename(path)}", overall_percentage)
                                 
         self.root.after(0, self.on_delete_complete)
 
@@ -962,9 +1795,20 @@ class DuplicateFinderWizard:
         self.delete_overall_percentage.config(text=f"{overall_percentage:.1f}%")
 
     def on_delete_complete(self):
+        deleted = set(self.files_to_delete)
+        for path in deleted:
+            self.photo_cache.pop(path, None)
+        for key in [key for key in self.preview_cache if key[0] in deleted]:
+            del self.preview_cache[key]
         self.prepare_virtualized_final_report()
         self.show_screen("final_report")
 
+    def _on_preview_canvas_configure(self, canvas, event):
+        canvas.cached_size = (event.width, event.height)
+        player = self.active_media_player
+        if isinstance(player, VideoPlayerCV) and player.canvas is canvas:
+            player.resize(preview_max_size(canvas))
+
     # --- Screen 5: Final Report (VIRTUALIZED) ---
     def _create_preview_pane(self, parent):
         preview_frame = ttk.LabelFrame(parent, text="Preview (no audio)")
@@ -973,6 +1817,8 @@ class DuplicateFinderWizard:
 
         preview_canvas = tk.Canvas(preview_frame, bg="black", width=PREVIEW_PANE_WIDTH, height=200,)
         preview_canvas.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        # Previews read this cached size instead of querying Tk on every click or frame
+        preview_canvas.bind("<Configure>", lambda e: self._on_preview_canvas_configure(preview_canvas, e))
         
         vid_controls = ttk.Frame(preview_frame)
         vid_play_btn = ttk.Button(vid_controls, text="▶", command=self.toggle_play_pause)
@@ -1015,7 +1861,7 @@ class DuplicateFinderWizard:
 
         self.final_canvas.pack(side="left", fill="both", expand=True)
         self.final_scrollbar.pack(side="right", fill="y")
-        self.final_canvas.bind("<Configure>", lambda e: self.root.after_idle(self.prepare_virtualized_final_report, True))
+        self.final_canvas.bind("<Configure>", lambda e: self._debounce("final_layout", GRID_RELAYOUT_DELAY_MS, self._on_final_report_resized))
         
         footer = ttk.Frame(frame)
         footer.pack(fill='x', pady=20, padx=20)
@@ -1026,11 +1872,18 @@ class DuplicateFinderWizard:
     def _on_final_report_scroll(self, *args):
         self.root.after_idle(self._update_visible_kept_files)
 
+    def _on_final_report_resized(self):
+        if grid_columns(self.final_canvas.winfo_width()) != self.kept_files_columns:
+            self.prepare_virtualized_final_report(True)
+        else:
+            self._update_visible_kept_files()
+
     def prepare_virtualized_final_report(self, re_layout=False):
         """Pre-calculates the layout for the final report's virtualized grid view."""
         for widget_id in self.active_kept_file_widgets.values():
             self.final_canvas.delete(widget_id)
         self.active_kept_file_widgets.clear()
+        self._cancel_all_thumbnails()
         
         self.kept_files_layout_info.clear()
         
@@ -1040,7 +1893,8 @@ class DuplicateFinderWizard:
         # Calculate sizes based on the fixed-size widgets we will create
         ITEM_WIDTH = (THUMBNAIL_SIZE[0] + 10) + 10  # Frame width + grid padx
         ITEM_HEIGHT = (THUMBNAIL_SIZE[1] + 50) + 10 # Frame height + grid pady
-        max_cols = max(1, container_width // ITEM_WIDTH)
+        max_cols = grid_columns(container_width)
+        self.kept_files_columns = max_cols
         
         # Calculate position for each item
         for i, filepath in enumerate(self.kept_files):
@@ -1079,10 +1933,14 @@ class DuplicateFinderWizard:
         render_bottom = min(total_height, view_bottom + buffer)
 
         ITEM_HEIGHT = (THUMBNAIL_SIZE[1] + 50) + 10
-        visible_paths = {
-            info['path'] for info in self.kept_files_layout_info 
-            if info['y'] + ITEM_HEIGHT > render_top and info['y'] < render_bottom
+        # Items sit on a fixed grid, so the rows in range give the visible slice directly
+        first_row = int(render_top // ITEM_HEIGHT)
+        last_row = -int(-render_bottom // ITEM_HEIGHT)
+        visible_infos = {
+            info['path']: info for info in
+            self.kept_files_layout_info[first_row * self.kept_files_columns:last_row * self.kept_files_columns]
         }
+        visible_paths = visible_infos.keys()
 
         rendered_paths = set(self.active_kept_file_widgets.keys())
         to_create = visible_paths - rendered_paths
@@ -1100,13 +1958,13 @@ class DuplicateFinderWizard:
                     pass
 
             self.thumbnail_widgets.pop(path, None)
+            self._cancel_thumbnail(path)
 
         for path in to_create:
-            info = next((i for i in self.kept_files_layout_info if i['path'] == path), None)
-            if info:
-                item_widget = self._create_kept_file_widget(path)
-                widget_id = self.final_canvas.create_window(info['x'], info['y'], window=item_widget, anchor="nw")
-                self.active_kept_file_widgets[path] = widget_id
+            info = visible_infos[path]
+            item_widget = self._create_kept_file_widget(path)
+            widget_id = self.final_canvas.create_window(info['x'], info['y'], window=item_widget, anchor="nw")
+            self.active_kept_file_widgets[path] = widget_id
 
     def _create_kept_file_widget(self, filepath):
         """Creates a single item widget for the final report with a fixed size."""
@@ -1120,15 +1978,21 @@ class DuplicateFinderWizard:
         self.thumbnail_widgets[filepath] = thumb_label
         
         # Truncate filename to fit, keeping the extension visible
-        filename = truncate_filename_with_ext(os.path.basename(filepath))
+        filename = truncate_filename_with_ext(self.get_file_meta(filepath)[0])
         ttk.Label(item_frame, text=filename, anchor="center").pack(fill='x', expand=True, pady=2)
-        threading.Thread(target=self.load_thumbnail, args=(filepath, thumb_label), daemon=True).start()
+        self._queue_thumbnail(filepath, thumb_label)
 
         return item_frame
         
     def close_app(self):
         if self.active_media_player:
             self.active_media_player.stop()
+        self.thumbnail_executor.shutdown(wait=False, cancel_futures=True)
+        self.thumbnail_decoder_pool.shutdown(wait=False, cancel_futures=True)
+        # A running scan stops submitting work, and its queued chunks are dropped
+        self.scan_cancelled = True
+        if self._hash_pool is not None:
+            self._hash_pool.shutdown(wait=False, cancel_futures=True)
         self.root.quit()
         self.root.destroy()
 
@@ -1166,37 +2030,63 @@ class GifPlayer:
         self.is_stopped = False
         self.photo_img = None
         self.thread = None
-        
+        self._frames = []  # (RGBA frame, duration) pairs, replaced as a whole so both always match
+        self._photo = None
+        self.frame_index = 0
+
+        max_size = preview_max_size(canvas)
+        canvas_width, canvas_height = preview_canvas_size(canvas)
+        canvas.delete("all")
+        canvas.create_text(canvas_width / 2, canvas_height / 2, text="Loading…", fill="white")
+        threading.Thread(target=self._load_sync, args=(max_size,), daemon=True).start()
+
+    def _load_sync(self, max_size):
+        """Decodes and resizes every frame off the Tk thread."""
+        pil_frames = []
         try:
-            self.image = Image.open(filepath)
-            self.frames = []
-            for frame in ImageSequence.Iterator(self.image):
-                duration = frame.info.get('duration', 100) / 1000.0
-                resized_frame = frame.copy()
-                canvas.update_idletasks()
-                canvas_width = canvas.winfo_width()
-                canvas_height = canvas.winfo_height()
-                
-                max_size = (canvas_width - 20, canvas_height - 20) if canvas_width > 1 and canvas_height > 1 else PREVIEW_SIZE
-                
-                resized_frame.thumbnail(max_size, Image.LANCZOS)
-                self.frames.append((ImageTk.PhotoImage(resized_frame), duration))
-            self.frame_index = 0
-            self.show_frame()
+            with Image.open(self.filepath) as image:
+                for frame in ImageSequence.Iterator(image):
+                    if self.is_stopped: return
+                    duration = frame.info.get('duration', 100) / 1000.0
+                    resized_frame = frame.convert('RGBA')
+                    resized_frame.thumbnail(max_size, Image.LANCZOS)
+                    pil_frames.append((resized_frame, duration))
         except Exception:
-            self.frames = []
+            pil_frames = []
+        try:
+            self.canvas.after(0, self._register, pil_frames)
+        except Exception:
+            pass
+
+    def _register(self, pil_frames):
+        """Publishes the decoded frames on the Tk thread."""
+        if self.is_stopped: return
+        self.frame_index = 0
+        self._frames = pil_frames
+        if pil_frames:
+            self.show_frame()
+        elif self.canvas.winfo_exists():
+            self.canvas.delete("all")
 
     def show_frame(self):
-        if not self.frames or not self.canvas.winfo_exists(): return
-        photo = self.frames[self.frame_index][0]
+        frames = self._frames
+        if not frames or not self.canvas.winfo_exists(): return
+        frame = frames[self.frame_index % len(frames)][0]
+        if self._photo is not None and self._photo.width() == frame.width and self._photo.height() == frame.height:
+            # Every frame shares one Tk image, so only its pixels change per tick
+            self._photo.paste(frame)
+            return
+        self._photo = ImageTk.PhotoImage(frame)
+        canvas_width, canvas_height = preview_canvas_size(self.canvas)
         self.canvas.delete("all")
-        self.canvas.create_image(self.canvas.winfo_width()/2, self.canvas.winfo_height()/2, anchor='center', image=photo)
+        self.canvas.create_image(canvas_width/2, canvas_height/2, anchor='center', image=self._photo)
         
     def play_loop(self):
         while not self.is_stopped:
-            if self.is_playing and self.frames:
-                self.frame_index = (self.frame_index + 1) % len(self.frames)
-                photo, delay = self.frames[self.frame_index]
+            frames = self._frames
+            if self.is_playing and frames:
+                self.frame_index = (self.frame_index + 1) % len(frames)
+                delay = frames[self.frame_index][1]
                 if self.canvas.winfo_exists():
                     self.canvas.after(0, self.show_frame)
                 time.sleep(delay)
@@ -1225,15 +2115,37 @@ class VideoPlayerCV:
         self.play_button = widgets['play']
         self.time_label = widgets['time_label']
         
-        self.cap = cv2.VideoCapture(filepath)
-        self.lock = threading.Lock()
+        # Only the playback thread touches the capture once it is running; other threads
+        # send it ("seek", frame), ("resize", max size), ("play",) and ("stop",) commands
+        self.cap = self._open_capture()
+        self._cap_open = self.cap.isOpened()
+        self._reached_end = False
+        self._commands = queue.SimpleQueue()
+        self._current_frame_idx = 0
+        self._cap_pos = 0  # Index of the next frame the capture will return
+        self._pending_grab = False  # Frame _cap_pos is already grabbed and only needs retrieving
+        self._next_frame = 0  # Index of the next frame playback should show
+        self._frame_cache = OrderedDict()  # Frame index -> prepared preview frame, oldest first
+        self._latest_frame = None  # Newest prepared frame posted for drawing
+        self._draw_scheduled = False
+        self._update_job = None  # Pending update_loop call
+        self._pending_seek = None
+        self._seek_job = None  # Pending _flush_seek call
         self.is_playing = False
         self.is_stopped = False
         self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self._verify_seeks = (video_fourcc(self.cap) in INEXACT_SEEK_FOURCCS
+                              or get_extension(filepath) in SEQUENTIAL_SAMPLING_EXTENSIONS)
         if self.frame_count > 0: self.seek_bar.config(to=self.frame_count - 1)
         self.photo_img = None
+        self._photo_layout = None  # (image size, canvas size) photo_img was placed for
         self.thread = None
+        self._frame_buf = None  # Decoded frames are read into this one array
+        self._target_size = None
+        self._max_size = None
+        # Measured on the Tk thread; the playback thread only receives it through "resize"
+        self._preview_size = self._requested_preview_size = preview_max_size(self.canvas)
         self.update_first_frame()
 
     def format_time(self, frame_number):
@@ -1245,99 +2157,273 @@ class VideoPlayerCV:
         return "00:00"
 
     def update_first_frame(self):
-        with self.lock:
-            ret, frame = self.cap.read()
-        if ret: self.show_frame(frame)
-        with self.lock:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        ret, frame = self._read_frame()
+        if ret: self.show_frame(self._remember_frame(0, self._prepare_frame(frame)))
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._cap_pos = 0
+        self._pending_grab = False
+
+    def _read_frame(self):
+        """Reads the next frame into the reused decode buffer; the capture owner only."""
+        if self._pending_grab:
+            self._pending_grab = False
+            ret, frame = self.cap.retrieve(self._frame_buf)
+        else:
+            ret, frame = self.cap.read(self._frame_buf)
+        if ret: self._frame_buf = frame
+        return ret, frame
+
+    def _prepare_frame(self, frame):
+        """Shrinks a decoded BGR frame to the preview size and returns it as a new array.
+        Runs on the capture owner, so the Tk thread never sees the reused decode buffer.
+        Colour order is left as BGR; PIL swaps it while copying the pixels in anyway."""
+        height, width = frame.shape[:2]
+        max_size = self._preview_size
+        if max_size != self._max_size:
+            self._max_size = max_size
+            scale = min(self._max_size[0] / width, self._max_size[1] / height, 1.0)
+            self._target_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            self._frame_cache.clear()
+        if self._target_size == (width, height):
+            return frame.copy()
+        return cv2.resize(frame, self._target_size, interpolation=cv2.INTER_AREA)
+
+    def _remember_frame(self, frame_num, frame):
+        self._frame_cache[frame_num] = frame
+        self._frame_cache.move_to_end(frame_num)
+        if len(self._frame_cache) > VIDEO_FRAME_CACHE_SIZE:
+            self._frame_cache.popitem(last=False)
+        return frame
 
-    def show_frame(self, frame):
+    def _post_frame(self, frame):
+        """Hands a frame to the Tk thread, keeping only the newest one; if Tk falls
+        behind, frames it never got to are dropped instead of queueing up."""
+        self._latest_frame = frame
+        if not self._draw_scheduled:
+            self._draw_scheduled = True
+            self.canvas.after(0, self._draw_latest_frame)
+
+    def _draw_latest_frame(self):
+        # Cleared before reading, so a frame posted meanwhile schedules another draw
+        self._draw_scheduled = False
+        frame = self._latest_frame
+        if frame is not None: self.show_frame(frame)
+
+    def show_frame(self, bgr):
         if not self.canvas.winfo_exists(): return
         try:
-            img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            self.canvas.update_idletasks()
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            max_size = (canvas_width - 20, canvas_height - 20) if canvas_width > 1 and canvas_height > 1 else PREVIEW_SIZE
-            
-            img.thumbnail(max_size, Image.LANCZOS)
+            height, width = bgr.shape[:2]
+            img = Image.frombuffer("RGB", (width, height), bgr, "raw", "BGR", 0, 1)
+            canvas_size = preview_canvas_size(self.canvas)
+            if self.photo_img is not None and self._photo_layout == (img.size, canvas_size):
+                # Same size and placement: update the existing Tk image's pixels in place
+                self.photo_img.paste(img)
+                return
             self.photo_img = ImageTk.PhotoImage(img)
+            self._photo_layout = (img.size, canvas_size)
             self.canvas.delete("all")
-            self.canvas.create_image(self.canvas.winfo_width()/2, self.canvas.winfo_height()/2, anchor='center', image=self.photo_img)
+            self.canvas.create_image(canvas_size[0]/2, canvas_size[1]/2, anchor='center', image=self.photo_img)
         except Exception: pass
 
     def play_loop(self):
+        """Owns the capture: serves seeks and, while playing, shows frames against a
+        clock so slow decodes drop frames instead of slowing playback down."""
         delay = 1.0 / self.fps if self.fps > 0 else 0.04
-        while not self.is_stopped:
-            if self.is_playing:
-                with self.lock:
-                    if not self.ensure_capture_open(): break
-                    ret, frame = self.cap.read()
+        next_due = None  # When the next frame should be shown; None restarts the clock
+        raise_current_thread_priority()
+        try:
+            while not self.is_stopped:
+                try:
+                    # While paused, sleep until a command arrives
+                    command = self._commands.get_nowait() if self.is_playing else self._commands.get()
+                except queue.Empty:
+                    command = None
+                if command is not None:
+                    if command[0] == "stop": break
+                    if command[0] == "resize":
+                        self._preview_size = command[1]
+                        continue
+                    if command[0] == "seek":
+                        if not self.ensure_capture_open(): break
+                        self._seek_to(command[1])
+                    next_due = None
+                if not self.is_playing:
+                    next_due = None
+                    continue
+                if not self.ensure_capture_open(): break
+                if self._cap_pos != self._next_frame:
+                    self._move_capture(self._next_frame)
+                now = time.monotonic()
+                if next_due is None:
+                    next_due = now
+                elif now - next_due > delay:
+                    # Behind schedule: skip the frames that are already late without decoding them
+                    late_frames = min(int((now - next_due) / delay), VIDEO_MAX_GRAB_GAP)
+                    for _ in range(late_frames):
+                        if not self.cap.grab(): break
+                        self._cap_pos += 1
+                    next_due += late_frames * delay
+                ret, frame = self._read_frame()
                 if not ret:
-                    self.stop()
-                    break
-                if self.canvas.winfo_exists():
-                    self.canvas.after(0, self.show_frame, frame)
-                time.sleep(delay)
-            else:
-                time.sleep(0.1)
+                    # End of the video: pause, keeping the capture open for seeks or a replay
+                    self._reached_end = True
+                    self.is_playing = False
+                    self.canvas.after(0, self.play_button.config, {"text": "▶"})
+                    continue
+                # Positions are counted here rather than queried from the capture every frame;
+                # show_frame checks on the Tk thread that the canvas still exists
+                self._cap_pos += 1
+                self._next_frame = self._current_frame_idx = self._cap_pos
+                self._post_frame(self._remember_frame(self._cap_pos - 1, self._prepare_frame(frame)))
+                next_due += delay
+                time.sleep(max(0.0, next_due - time.monotonic()))
+        finally:
+            if self.is_stopped:
+                self._cap_open = False
+                self.cap.release()
 
     def update_loop(self):
         if self.is_stopped or not self.canvas.winfo_exists(): return
-        current_frame = 0
-        with self.lock:
-            if self.ensure_capture_open():
-                current_frame = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
+        current_frame = self._current_frame_idx
         
         self.seek_bar.set(current_frame)
         total_time_str = self.format_time(self.frame_count)
         current_time_str = self.format_time(current_frame)
         self.time_label.config(text=f"{current_time_str} / {total_time_str}")
         
-        if self.is_playing:
-            self.canvas.after(500, self.update_loop)
+        self._update_job = self.canvas.after(500, self.update_loop) if self.is_playing else None
 
     def toggle_play_pause(self):
         self.is_playing = not self.is_playing
         if self.is_playing:
-            with self.lock:
-                if not self.ensure_capture_open():
-                    self.is_playing = False
-                    return
+            if not self._playback_thread_alive() and not self.ensure_capture_open():
+                self.is_playing = False
+                return
             self.play_button.config(text="❚❚")
-            if not self.thread or not self.thread.is_alive():
-                self.is_stopped = False
-                self.thread = threading.Thread(target=self.play_loop, daemon=True)
-                self.thread.start()
-                self.update_loop()
+            if self._reached_end:
+                # Replay from the start on the capture that is already open
+                self._reached_end = False
+                self._commands.put(("seek", 0))
+            self._commands.put(("play",))
+            self._ensure_playback_thread()
+            if self._update_job is not None:
+                self.canvas.after_cancel(self._update_job)
+            self.update_loop()
         else:
             self.play_button.config(text="▶")
 
-    def seek(self, frame_num_str):
-        with self.lock:
-            if not self.ensure_capture_open(): return
-            frame_num = int(float(frame_num_str))
+    def _ensure_playback_thread(self):
+        if not self._playback_thread_alive():
+            self.thread = threading.Thread(target=self.play_loop, daemon=True)
+            self.thread.start()
+
+    def seek(self, position):
+        """Records the slider position; a drag's events are flushed at most every
+        VIDEO_SEEK_COALESCE_MS, so only the latest position gets decoded. Positions
+        that land on the frame already shown or pending are ignored, which includes
+        update_loop moving the slider during playback."""
+        frame_num = int(position)
+        current = self._current_frame_idx if self._pending_seek is None else self._pending_seek
+        if frame_num == current: return
+        self._pending_seek = frame_num
+        if self._seek_job is None:
+            self._seek_job = self.canvas.after(VIDEO_SEEK_COALESCE_MS, self._flush_seek)
+
+    def resize(self, max_size):
+        """Passes a new preview size, measured on the Tk thread, to the playback thread."""
+        if max_size != self._requested_preview_size and not self.is_stopped:
+            self._requested_preview_size = max_size
+            self._commands.put(("resize", max_size))
+
+    def _flush_seek(self):
+        """Hands the latest seek to the playback thread, which decodes it off the Tk thread."""
+        self._seek_job = None
+        frame_num, self._pending_seek = self._pending_seek, None
+        if frame_num is None or self.is_stopped: return
+        self._reached_end = False
+        self._commands.put(("seek", frame_num))
+        self._ensure_playback_thread()
+
+    def _seek_to(self, frame_num):
+        """Jumps playback to frame_num; must run on the thread that owns the capture.
+        While paused the frame is shown straight away, from the frame cache if possible."""
+        self._current_frame_idx = self._next_frame = frame_num
+        if self.is_playing: return
+        shown = self._frame_cache.get(frame_num)
+        if shown is None:
+            self._move_capture(frame_num)
+            ret, frame = self._read_frame()
+            if not ret: return
+            self._cap_pos += 1
+            shown = self._remember_frame(frame_num, self._prepare_frame(frame))
+        else:
+            self._frame_cache.move_to_end(frame_num)
+        self._next_frame = frame_num + 1
+        self._post_frame(shown)
+
+    def _move_capture(self, frame_num):
+        """Short forward moves decode ahead with grab() rather than reseeking, which would
+        restart decoding from the previous keyframe."""
+        gap = frame_num - self._cap_pos
+        if not (0 <= gap <= VIDEO_MAX_GRAB_GAP and all(self.cap.grab() for _ in range(gap))):
+            self._pending_grab = False
             self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-            if not self.is_playing:
-                ret, frame = self.cap.read()
-                if ret: self.canvas.after(0, self.show_frame, frame)
+            if self._verify_seeks:
+                self._correct_landing(frame_num)
+        self._cap_pos = frame_num
+
+    def _grabbed_frame_index(self):
+        """Index of the frame the last grab() decoded, from its timestamp. After a seek,
+        CAP_PROP_POS_FRAMES echoes the requested frame rather than where decoding landed."""
+        return round(self.cap.get(cv2.CAP_PROP_POS_MSEC) * self.fps / 1000)
+
+    def _correct_landing(self, frame_num):
+        """Grabs the frame a seek landed on and checks its timestamp: a seek that stopped
+        short decodes forward to frame_num, one that overshot retries from a little
+        earlier. Leaves frame_num grabbed for _read_frame to retrieve."""
+        if self.fps <= 0 or not self.cap.grab(): return
+        landed = self._grabbed_frame_index()
+        if landed > frame_num:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, max(0, frame_num - VIDEO_MAX_GRAB_GAP))
+            if not self.cap.grab(): return
+            landed = self._grabbed_frame_index()
+        while landed < frame_num and self.cap.grab():
+            landed += 1
+        self._pending_grab = True
+
+    def _playback_thread_alive(self):
+        return self.thread is not None and self.thread.is_alive()
 
     def stop(self):
         self.is_stopped = True
         self.is_playing = False
+        self._commands.put(("stop",))
         if hasattr(self, 'play_button') and self.play_button.winfo_exists(): self.play_button.config(text="▶")
-        with self.lock:
-            if self.cap.isOpened(): self.cap.release()
+        # A running playback thread releases the capture itself on its way out
+        if not self._playback_thread_alive() and self._cap_open:
+            self._cap_open = False
+            self.cap.release()
+
+    def _open_capture(self):
+        cap = open_video_capture(self.filepath, hw_accel=True)
+        # Keep only the frame being shown; backends without the property ignore it
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
 
     def ensure_capture_open(self):
-        if not self.cap.isOpened():
-            self.cap = cv2.VideoCapture(self.filepath)
-            return self.cap.isOpened()
-        return True
+        """Reopens a released capture; the open state is cached so the per-frame check
+        doesn't call into OpenCV."""
+        if not self._cap_open:
+            self.cap = self._open_capture()
+            self._cap_pos = 0
+            self._pending_grab = False
+            self._cap_open = self.cap.isOpened()
+        return self._cap_open
 
 # --- Main Execution ---
 if __name__ == "__main__":
+    # Required for the hashing process pool in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     root = tk.Tk()
     
     # Configure a modern theme